@@ -0,0 +1,149 @@
+# Author: Jin Huang
+# Description: Implement an ApproxBag class: a count-min sketch with the add/count/size
+#              interface of Bag, for streams too large to keep every value.
+
+from array import array
+from hashlib import blake2b
+from math import ceil, e, log
+from dynamic_array import *
+
+
+class ApproxBagException(Exception):
+    """
+    Custom exception to be used by ApproxBag class
+    """
+    pass
+
+
+def _encode(value: object) -> bytes:
+    """
+    Return a byte string identifying value that is the same in every process.
+    Only str, bytes, int, float (bool included) and tuples of those have such an encoding:
+    repr() of e.g. a frozenset depends on the per-process hash seed.
+    Numbers that compare equal (1, 1.0, True) encode the same, as they count together in Bag.
+    Any other type raises ApproxBagException.
+    """
+    if isinstance(value, str):
+        return b's' + value.encode('utf-8', 'surrogatepass')
+    if isinstance(value, bytes):
+        return b'b' + value
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int):
+        return b'i%x' % int(value)
+    if isinstance(value, float):
+        return b'f' + repr(value).encode()
+    if isinstance(value, tuple):
+        out = bytearray(b't')
+        for item in value:
+            encoded = _encode(item)
+            out += len(encoded).to_bytes(8, 'little') + encoded
+        return bytes(out)
+    raise ApproxBagException
+
+
+class ApproxBag:
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01, seed: int = 0, start_bag=None):
+        """
+        Init new approximate bag backed by a count-min sketch
+        count(value) never under-counts, and with probability at least 1 - delta it over-counts
+        by at most epsilon * size(). Memory is fixed at width * depth counters,
+        width = ceil(e / epsilon) and depth = ceil(ln(1 / delta)), however long the stream.
+        Values must be str, bytes, int, float or tuples of those (see _encode()), so that
+        every process hashes them alike; add() and count() raise ApproxBagException otherwise.
+        Sketches built with the same epsilon, delta and seed can be merged.
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ApproxBagException
+        self.epsilon = epsilon
+        self.delta = delta
+        self.seed = seed
+        self.width = ceil(e / epsilon)
+        self.depth = ceil(log(1 / delta))
+        self.total = 0
+
+        # depth rows of width unsigned 64-bit counters, row after row
+        self.table = DynamicArray(typecode='Q')
+        self.table.extend(array('Q', bytes(8 * self.width * self.depth)))
+
+        if start_bag is not None:
+            for value in start_bag:
+                self.add(value)
+
+    def __str__(self) -> str:
+        """
+        Return a summary of the sketch in human-readable form
+        """
+        return "APPROX_BAG: " + str(self.total) + " elements. [" + \
+            str(self.depth) + " x " + str(self.width) + " counters]"
+
+    def size(self) -> int:
+        """
+        Return total number of items added to the bag (exact)
+        """
+        return self.total
+
+    # -----------------------------------------------------------------------
+
+    def _positions(self, value: object):
+        """
+        Yield the table position of value's counter in each row, using double hashing
+        of one 128-bit digest: row i uses (h1 + i * h2) mod width
+        """
+        digest = blake2b(_encode(value), digest_size=16, key=self.seed.to_bytes(8, 'little')).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for row in range(self.depth):
+            yield row * self.width + (h1 + row * h2) % self.width
+
+    def add(self, value: object, count: int = 1) -> None:
+        """
+        Adds count occurrences of value to the bag. O(depth) complexity.
+        """
+        if count < 0:
+            raise ApproxBagException
+        data = self.table.data
+        for pos in self._positions(value):
+            data[pos] += count
+        self.total += count
+
+        return self
+
+    def count(self, value: object) -> int:
+        """
+        Returns the estimated number of elements in the bag that match "value". O(depth) complexity.
+        """
+        data = self.table.data
+        return min(data[pos] for pos in self._positions(value))
+
+    def error_bound(self) -> float:
+        """
+        Returns the over-count that count() stays within with probability 1 - delta
+        """
+        return self.epsilon * self.total
+
+    def merge(self, second_bag: object) -> None:
+        """
+        Adds the counters of another ApproxBag (e.g. built by another worker process) into this one.
+        Both sketches must share epsilon, delta and seed, or ApproxBagException is raised.
+        """
+        if (self.width, self.depth, self.seed) != (second_bag.width, second_bag.depth, second_bag.seed):
+            raise ApproxBagException
+
+        data = self.table.data
+        other = second_bag.table.data
+        for i in range(self.width * self.depth):
+            data[i] += other[i]
+        self.total += second_bag.total
+
+        return self
+
+    def max_error(self, exact_bag: object) -> int:
+        """
+        Test harness: returns the largest over-count of this sketch, over every distinct
+        value of an exact Bag fed the same stream
+        """
+        worst = 0
+        for value, count in exact_bag.counts.items():
+            worst = max(worst, self.count(value) - count)
+        return worst
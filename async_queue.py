@@ -0,0 +1,170 @@
+# Author: Jin Huang
+# Description: Implement an AsyncQueue class: an asyncio companion to Queue with
+#              awaitable enqueue/dequeue, optional capacity and batched dequeue.
+
+import asyncio
+from collections import deque
+from queue_dynamic_array import *
+
+
+class AsyncQueue:
+    def __init__(self, capacity: int = None):
+        """
+        Init new asyncio queue, unbounded unless capacity is given
+        Waiting consumers (and producers, when bounded) are served strictly first come, first served:
+        each waiter sits in a FIFO deque of futures, and waking one reserves an element (or a slot)
+        for it, so a task arriving later cannot take it first. A waiter cancelled before being woken
+        removes its future from the deque.
+        Must be used from a single event loop.
+        """
+        if capacity is not None and capacity <= 0:
+            raise QueueException
+        self.capacity = capacity
+        self.queue = Queue()
+        self.getters = deque()          # futures of consumers waiting for an element
+        self.putters = deque()          # futures of producers waiting for a free slot
+        self.reserved_items = 0         # elements promised to woken consumers
+        self.reserved_slots = 0         # slots promised to woken producers
+
+    def __str__(self):
+        """
+        Return content of queue in human-readable form
+        """
+        return "ASYNC_" + str(self.queue)
+
+    def is_empty(self) -> bool:
+        """
+        Return True is the queue is empty, False otherwise
+        """
+        return self.queue.is_empty()
+
+    def is_full(self) -> bool:
+        """
+        Return True is the queue is at capacity, False otherwise (never full when unbounded)
+        """
+        return self.capacity is not None and self.queue.size() >= self.capacity
+
+    def size(self) -> int:
+        """
+        Return number of elements currently in the queue
+        """
+        return self.queue.size()
+
+    # -----------------------------------------------------------------------
+
+    def _available_items(self) -> int:
+        """
+        Return number of queued elements not promised to a woken consumer
+        """
+        return self.queue.size() - self.reserved_items
+
+    def _free_slots(self) -> int:
+        """
+        Return number of free slots not promised to a woken producer
+        """
+        if self.capacity is None:
+            return 1
+        return self.capacity - self.queue.size() - self.reserved_slots
+
+    def _notify_getters(self) -> None:
+        """
+        Wake the longest-waiting consumers, one per unpromised element
+        """
+        while self.getters and self._available_items() > 0:
+            waiter = self.getters.popleft()
+            if waiter.done():           # cancelled, its task not yet resumed to remove it
+                continue
+            waiter.set_result(None)
+            self.reserved_items += 1
+
+    def _notify_putters(self) -> None:
+        """
+        Wake the longest-waiting producers, one per unpromised free slot
+        """
+        while self.putters and self._free_slots() > 0:
+            waiter = self.putters.popleft()
+            if waiter.done():           # cancelled, its task not yet resumed to remove it
+                continue
+            waiter.set_result(None)
+            self.reserved_slots += 1
+
+    async def _wait_for_item(self) -> None:
+        """
+        Wait in line until an element is reserved for this consumer
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self.getters.append(waiter)
+        self._notify_getters()                   # skips waiters cancelled ahead of us whose tasks have not run yet
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # woken, then cancelled before running: pass the element on
+                self.reserved_items -= 1
+                self._notify_getters()
+            elif waiter in self.getters:
+                self.getters.remove(waiter)
+            raise
+        self.reserved_items -= 1
+
+    async def _wait_for_slot(self) -> None:
+        """
+        Wait in line until a free slot is reserved for this producer
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self.putters.append(waiter)
+        self._notify_putters()                   # skips waiters cancelled ahead of us whose tasks have not run yet
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # woken, then cancelled before running: pass the slot on
+                self.reserved_slots -= 1
+                self._notify_putters()
+            elif waiter in self.putters:
+                self.putters.remove(waiter)
+            raise
+        self.reserved_slots -= 1
+
+    async def enqueue(self, value: object) -> None:
+        """
+        Adds a new value to the end of the queue.
+        If the queue is bounded and full, waits for a free slot.
+        """
+        if self.putters or self._free_slots() <= 0:
+            await self._wait_for_slot()
+
+        self.queue.enqueue(value)
+        self._notify_getters()
+
+        return self
+
+    async def dequeue(self) -> object:
+        """
+        Removes and returns the value at the beginning of the queue.
+        If the queue is empty, waits for a value.
+        """
+        if self.getters or self._available_items() <= 0:
+            await self._wait_for_item()
+
+        value = self.queue.dequeue()
+        self._notify_putters()
+
+        return value
+
+    async def dequeue_up_to(self, count: int) -> DynamicArray:
+        """
+        Removes and returns (in a Dynamic Array) between 1 and count values from the beginning of the queue,
+        waiting only if the queue is empty. A consumer woken for one element takes every unpromised
+        element up to count, so a burst of enqueues wakes it once rather than once per element.
+        If count < 1: raises "QueueException".
+        """
+        if count < 1:
+            raise QueueException
+        if self.getters or self._available_items() <= 0:
+            await self._wait_for_item()
+
+        values = self.queue.dequeue_many(min(count, self._available_items()))
+        self._notify_putters()
+
+        return values
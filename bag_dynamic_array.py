@@ -1,18 +1,35 @@
 # Author: Jin Huang
 # Description: Implement a Bag ADT class using Dynamic Array.
 
+from heapq import nlargest
+import random
 from dynamic_array import *
 
 
+class BagException(Exception):
+    """
+    Custom exception to be used by Bag class
+    """
+    pass
+
+
 class Bag:
     def __init__(self, start_bag=None):
         """
-        Init new bag based on Dynamic Array
+        Init new bag
+        Values are kept as a value -> multiplicity map, so add/remove/count are O(1) on average
+        and equal() is O(N). Values must therefore be hashable.
+        The elements are still available, read-only, through the da property.
         """
-        self.da = DynamicArray()
+        self.counts = {}
+        self.total = 0
+        self._da = None                 # cached Dynamic Array of the elements, rebuilt after changes
+        self._slots = None              # sampler: value -> Fenwick tree slot, None until built
+        self._slot_values = None        # sampler: value held by each slot
+        self._tree = None               # sampler: 1-based Fenwick tree of slot counts
+        self._empty_slots = 0           # sampler: slots whose value is no longer in the bag
 
         # populate bag with initial values (if provided)
-        # before using this feature, implement add() method
         if start_bag is not None:
             for value in start_bag:
                 self.add(value)
@@ -21,27 +38,75 @@ class Bag:
         """
         Return content of stack in human-readable form
         """
-        out = "BAG: " + str(self.da.length()) + " elements. ["
-        out += ', '.join([str(self.da.get_at_index(_))
-                          for _ in range(self.da.length())])
+        out = "BAG: " + str(self.total) + " elements. ["
+        out += ', '.join([str(value) for value in self])
         return out + ']'
 
+    def __iter__(self):
+        """
+        Iterate over every element, repeating each value by its multiplicity
+        """
+        for value, count in self.counts.items():
+            for _ in range(count):
+                yield value
+
+    @property
+    def da(self) -> DynamicArraySnapshot:
+        """
+        The bag's elements as a read-only DynamicArraySnapshot (equal values are adjacent).
+        Built on first access after a change. Writing to it raises DynamicArrayException;
+        change the bag through add()/remove() instead.
+        """
+        if self._da is None:
+            self._da = DynamicArray(self).snapshot()
+        return self._da
+
     def size(self) -> int:
         """
         Return total number of items currently in the bag
         """
-        return self.da.length()
+        return self.total
+
+    @classmethod
+    def _from_counts(cls, counts: dict) -> object:
+        """
+        Return a new bag that takes ownership of a value -> multiplicity map (all counts > 0)
+        """
+        bag = cls()
+        return bag._set_counts(counts)
+
+    def _set_counts(self, counts: dict) -> object:
+        """
+        Replace the bag's contents with a value -> multiplicity map (all counts > 0)
+        """
+        self.counts = counts
+        self.total = sum(counts.values())
+        self._da = None
+        self._slots = None
+        return self
 
     # -----------------------------------------------------------------------
 
     def add(self, value: object) -> None:
         """
-        Adds a new element to the bag. O(1) amortized complexity.
+        Adds a new element to the bag. O(1) average complexity.
         """
-        # use Dynamic Array append method
-        self.da.append(value)
+        count = self.counts.get(value, 0)
+        self.counts[value] = count + 1
+        self.total += 1
+        self._da = None
+
+        # keep a built sampler in step; a brand new value needs a new slot, so rebuild lazily
+        if self._slots is not None:
+            slot = self._slots.get(value)
+            if slot is None:
+                self._slots = None
+            else:
+                self._tree_add(slot, 1)
+                if count == 0:
+                    self._empty_slots -= 1
 
-        return self.da
+        return self
 
 
     def remove(self, value: object) -> bool:
@@ -49,40 +114,44 @@ class Bag:
         Removes any one element from the bag that matches the value object.
         Returns True if the removal is successful.
         Otherwise, returns False.
-        O(N) runtime complexity
+        O(1) average complexity
         """
-        for i in range(self.da.length()):
-            bag_value = self.da.get_at_index(i)
-            if bag_value == value:
-                self.da.remove_at_index(i)
-                return True
-        return False
+        count = self.counts.get(value, 0)
+        if count == 0:
+            return False
+
+        if count == 1:
+            del self.counts[value]
+        else:
+            self.counts[value] = count - 1
+        self.total -= 1
+        self._da = None
+
+        if self._slots is not None:
+            self._tree_add(self._slots[value], -1)
+            if count == 1:
+                self._empty_slots += 1
+                if self._empty_slots * 2 > len(self._slot_values):
+                    self._slots = None
+
+        return True
 
 
     def count(self, value: object) -> int:
         """
-        Counts the number of elements in the bag that match "value". O(N) runtime complexity.
+        Counts the number of elements in the bag that match "value". O(1) average complexity.
         """
-        counter = 0
-        for i in range(self.da.length()):
-            bag_value = self.da.get_at_index(i)
-            if bag_value == value:
-                counter += 1
-        return counter
+        return self.counts.get(value, 0)
 
 
     def clear(self) -> None:
         """
         Clears the contents of the bag. O(1) runtime
         """
-        # empty bag to clear
-        if self.da.length() == 0:
-            return self
-        else:
-            # use slice to create an empty dynamic array
-            new_arr = self.da.slice(0,0)
-
-            self.da = new_arr           # assign to the original array
+        self.counts = {}
+        self.total = 0
+        self._da = None
+        self._slots = None
 
         return self
 
@@ -93,24 +162,199 @@ class Bag:
         Returns True if equal (have the same number of elements && contain the same elements)
         Returns False otherwise
         Empty bag is equal to another empty bag
+        O(N) in the number of distinct values
         """
-        bag1_size = self.da.length()
-        bag2_size = second_bag.da.length()
+        if self.total != second_bag.total:
+            return False
 
-        # empty bags
-        if bag1_size == bag2_size == 0:
-            return True
+        # same total: equal exactly when every multiplicity matches
+        return self.counts == second_bag.counts
+
+
+    def most_common(self, k: int = None) -> DynamicArray:
+        """
+        Returns a Dynamic Array of the k (value, count) pairs with the highest counts, most common first.
+        Without k, every distinct value is returned. O(D log k) for D distinct values.
+        """
+        if k is None:
+            k = len(self.counts)
+        if k <= 0:
+            return DynamicArray()
+        return DynamicArray(nlargest(k, self.counts.items(), key=lambda item: item[1]))
+
+
+    # ------------------- Weighted sampling ----------------------------------
+    # A Fenwick (binary indexed) tree over the distinct values' counts gives O(log D) draws.
+    # It is built on the first sample() and then updated in O(log D) by add()/remove();
+    # only new distinct values (or many emptied slots) trigger a lazy O(D) rebuild.
+
+    def _build_sampler(self) -> None:
+        """
+        Build the Fenwick tree over the current counts in O(D)
+        """
+        self._slots = {}
+        self._slot_values = []
+        tree = [0]
+        for value, count in self.counts.items():
+            self._slots[value] = len(self._slot_values)
+            self._slot_values.append(value)
+            tree.append(count)
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._empty_slots = 0
+
+    def _tree_add(self, slot: int, delta: int) -> None:
+        """
+        Add delta to the weight of slot in O(log D)
+        """
+        tree = self._tree
+        i = slot + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _tree_find(self, target: int) -> int:
+        """
+        Return the slot whose cumulative weight range contains target (0 <= target < total weight)
+        """
+        tree = self._tree
+        pos = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] <= target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def sample(self, k: int = 1, with_replacement: bool = True) -> DynamicArray:
+        """
+        Returns a Dynamic Array of k elements drawn at random, each value with probability
+        proportional to its count. O(log D) per draw for D distinct values.
+        Without replacement, drawn elements are taken out for the remaining draws only;
+        the bag itself is not modified.
+        Raises BagException if k is negative, or if the bag holds too few elements.
+        """
+        if k < 0 or (k > 0 and self.total == 0) or (not with_replacement and k > self.total):
+            raise BagException
+        if self._slots is None:
+            self._build_sampler()
+
+        result = DynamicArray()
+        result.reserve(k)
+        total = self.total
+        taken = []
+        for _ in range(k):
+            slot = self._tree_find(random.randrange(total))
+            result.append(self._slot_values[slot])
+            if not with_replacement:
+                self._tree_add(slot, -1)
+                taken.append(slot)
+                total -= 1
+
+        # put back the elements taken out for the draw
+        for slot in taken:
+            self._tree_add(slot, 1)
+
+        return result
 
-        if bag1_size != bag2_size:
-            return False
 
-        # use count method and compare the count of each element in two bags
-        if bag1_size == bag2_size:
-            for i in range(bag1_size):
-                bag1_value = self.da.get_at_index(i)
-                bag1_value_count = self.count(bag1_value)
-                bag2_value_count = second_bag.count(bag1_value)
-                if bag1_value_count != bag2_value_count:
-                    return False
-            return True
+    # ------------------- Multiset algebra -----------------------------------
+    # Each operation works on the multiplicity maps, so it is linear in the number of
+    # distinct values and builds the result without per-element add() calls.
+
+    def _union_counts(self, second_bag: object) -> dict:
+        """
+        Return the map of the larger of both bags' multiplicities
+        """
+        counts = dict(self.counts)
+        for value, count in second_bag.counts.items():
+            if count > counts.get(value, 0):
+                counts[value] = count
+        return counts
+
+    def _intersection_counts(self, second_bag: object) -> dict:
+        """
+        Return the map of the smaller of both bags' multiplicities
+        """
+        small, large = self.counts, second_bag.counts
+        if len(large) < len(small):
+            small, large = large, small
+        counts = {}
+        for value, count in small.items():
+            other = large.get(value, 0)
+            if other > 0:
+                counts[value] = min(count, other)
+        return counts
+
+    def _difference_counts(self, second_bag: object) -> dict:
+        """
+        Return the map of this bag's multiplicities minus second_bag's, dropping non-positive ones
+        """
+        counts = {}
+        for value, count in self.counts.items():
+            remaining = count - second_bag.counts.get(value, 0)
+            if remaining > 0:
+                counts[value] = remaining
+        return counts
+
+    def _sum_counts(self, second_bag: object) -> dict:
+        """
+        Return the map of the sum of both bags' multiplicities
+        """
+        counts = dict(self.counts)
+        for value, count in second_bag.counts.items():
+            counts[value] = counts.get(value, 0) + count
+        return counts
+
+    def union(self, second_bag: object) -> object:
+        """
+        Returns a new bag holding each value max(count in self, count in second_bag) times.
+        """
+        return Bag._from_counts(self._union_counts(second_bag))
 
+    def intersection(self, second_bag: object) -> object:
+        """
+        Returns a new bag holding each value min(count in self, count in second_bag) times.
+        """
+        return Bag._from_counts(self._intersection_counts(second_bag))
+
+    def difference(self, second_bag: object) -> object:
+        """
+        Returns a new bag holding each value (count in self - count in second_bag) times, if positive.
+        """
+        return Bag._from_counts(self._difference_counts(second_bag))
+
+    def sum(self, second_bag: object) -> object:
+        """
+        Returns a new bag holding every element of both bags (multiplicities are added).
+        """
+        return Bag._from_counts(self._sum_counts(second_bag))
+
+    def union_update(self, second_bag: object) -> object:
+        """
+        In-place union(): updates this bag and returns it.
+        """
+        return self._set_counts(self._union_counts(second_bag))
+
+    def intersection_update(self, second_bag: object) -> object:
+        """
+        In-place intersection(): updates this bag and returns it.
+        """
+        return self._set_counts(self._intersection_counts(second_bag))
+
+    def difference_update(self, second_bag: object) -> object:
+        """
+        In-place difference(): updates this bag and returns it.
+        """
+        return self._set_counts(self._difference_counts(second_bag))
+
+    def sum_update(self, second_bag: object) -> object:
+        """
+        In-place sum(): updates this bag and returns it.
+        """
+        return self._set_counts(self._sum_counts(second_bag))
@@ -0,0 +1,56 @@
+# Author: Jin Huang
+# Description: Benchmark per-call append latency of DynamicArray against SegmentedDynamicArray:
+#              p50 / p99 / p99.99 / max over N appends, in object and typed ('q') storage.
+#              Run from the repository root: python benchmarks/bench_append_latency.py [N]
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dynamic_array import *
+from segmented_dynamic_array import SegmentedDynamicArray
+
+
+def latencies(seq, n: int) -> list:
+    """
+    Return the sorted latency of each of n appends to seq, in microseconds
+    """
+    clock = time.perf_counter_ns
+    append = seq.append
+    result = [0] * n
+    gc.disable()
+    try:
+        for i in range(n):
+            start = clock()
+            append(i)
+            result[i] = clock() - start
+    finally:
+        gc.enable()
+    result.sort()
+    return [ns / 1000 for ns in result]
+
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Return the value at the given fraction of a sorted list
+    """
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print("N =", n, "appends, latency in microseconds")
+    print("%-26s %8s %8s %10s %12s" % ("array", "p50", "p99", "p99.99", "max"))
+    for label, make in (("DynamicArray", lambda: DynamicArray()),
+                        ("DynamicArray 'q'", lambda: DynamicArray(typecode='q')),
+                        ("SegmentedDynamicArray", lambda: SegmentedDynamicArray()),
+                        ("SegmentedDynamicArray 'q'", lambda: SegmentedDynamicArray(typecode='q'))):
+        values = latencies(make(), n)
+        print("%-26s %8.2f %8.2f %10.2f %12.2f" % (label, percentile(values, 0.5), percentile(values, 0.99),
+                                                   percentile(values, 0.9999), values[-1]))
+
+
+if __name__ == '__main__':
+    main()
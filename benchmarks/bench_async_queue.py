@@ -0,0 +1,89 @@
+# Author: Jin Huang
+# Description: Benchmark AsyncQueue under 10k concurrent tasks against asyncio.Queue,
+#              and count the consumer's awaits with dequeue() versus batched dequeue_up_to().
+#              Run from the repository root: python benchmarks/bench_async_queue.py [TASKS]
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from async_queue import AsyncQueue
+
+PER_TASK = 10
+BATCH = 64
+
+
+async def fan_in(tasks: int, capacity: int, standard: bool) -> float:
+    """
+    Return the time for tasks producers and tasks consumers to move PER_TASK items each
+    """
+    if standard:
+        queue = asyncio.Queue(capacity)
+        put, get = queue.put, queue.get
+    else:
+        queue = AsyncQueue(capacity)
+        put, get = queue.enqueue, queue.dequeue
+
+    async def produce() -> None:
+        for i in range(PER_TASK):
+            await put(i)
+
+    async def consume() -> None:
+        for _ in range(PER_TASK):
+            await get()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[produce() for _ in range(tasks)], *[consume() for _ in range(tasks)])
+    return time.perf_counter() - start
+
+
+async def awaits(tasks: int, batched: bool) -> tuple:
+    """
+    Return (consumer awaits, seconds) for one consumer draining tasks * PER_TASK items
+    sent in bursts by tasks producers, with dequeue() or dequeue_up_to(BATCH)
+    """
+    queue = AsyncQueue()
+    total = tasks * PER_TASK
+    count = 0
+
+    async def produce() -> None:
+        for i in range(PER_TASK):
+            await queue.enqueue(i)
+            await asyncio.sleep(0)
+
+    async def consume() -> None:
+        nonlocal count
+        received = 0
+        while received < total:
+            if batched:
+                received += (await queue.dequeue_up_to(BATCH)).length()
+            else:
+                await queue.dequeue()
+                received += 1
+            count += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(consume(), *[produce() for _ in range(tasks)])
+    return count, time.perf_counter() - start
+
+
+def main() -> None:
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(tasks, "producer and", tasks, "consumer tasks,", PER_TASK, "items each")
+    print("%-22s %12s %14s" % ("capacity", "AsyncQueue s", "asyncio.Queue s"))
+    for capacity in (0, 1024, 16):
+        mine = asyncio.run(fan_in(tasks, capacity or None, False))
+        standard = asyncio.run(fan_in(tasks, capacity, True))
+        print("%-22s %12.3f %14.3f" % (capacity or "unbounded", mine, standard))
+
+    print("one consumer,", tasks, "producers sending in bursts")
+    print("%-22s %12s %14s" % ("dequeue", "awaits", "seconds"))
+    for label, batched in (("dequeue()", False), ("dequeue_up_to(%d)" % BATCH, True)):
+        count, elapsed = asyncio.run(awaits(tasks, batched))
+        print("%-22s %12d %14.3f" % (label, count, elapsed))
+
+
+if __name__ == '__main__':
+    main()
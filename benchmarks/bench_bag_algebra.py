@@ -0,0 +1,78 @@
+# Author: Jin Huang
+# Description: Benchmark Bag union/intersection/difference/sum against doing it by hand:
+#              nested loops over the bags' elements, and per-element add() calls for sum.
+#              Run from the repository root: python benchmarks/bench_bag_algebra.py [N]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bag_dynamic_array import Bag
+
+
+def nested_intersection(first: list, second: list) -> list:
+    """
+    Intersection by hand: each element of first consumes one equal element of second
+    """
+    remaining = list(second)
+    result = []
+    for value in first:
+        for i in range(len(remaining)):
+            if remaining[i] == value:
+                result.append(value)
+                del remaining[i]
+                break
+    return result
+
+
+def nested_difference(first: list, second: list) -> list:
+    """
+    Difference by hand: each element of second cancels one equal element of first
+    """
+    remaining = list(first)
+    for value in second:
+        for i in range(len(remaining)):
+            if remaining[i] == value:
+                del remaining[i]
+                break
+    return remaining
+
+
+def nested_union(first: list, second: list) -> list:
+    """
+    Union by hand: first plus the elements of second that first does not already cover
+    """
+    return first + nested_difference(second, first)
+
+
+def timed(func) -> tuple:
+    """
+    Return (result, wall time in seconds) of func()
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    rng = random.Random(1)
+    first = [rng.randrange(n // 4) for _ in range(n)]
+    second = [rng.randrange(n // 4) for _ in range(n)]
+    bag1, bag2 = Bag(first), Bag(second)
+    print("N =", n, "elements per bag,", n // 4, "distinct event IDs")
+    print("%-14s %10s %14s %10s" % ("operation", "Bag s", "by hand s", "ratio"))
+    for label, method, nested in (("union", Bag.union, nested_union),
+                                  ("intersection", Bag.intersection, nested_intersection),
+                                  ("difference", Bag.difference, nested_difference),
+                                  ("sum", Bag.sum, lambda a, b: Bag(a + b))):
+        result, t_bag = timed(lambda: method(bag1, bag2))
+        expected, t_nested = timed(lambda: nested(first, second))
+        assert result.equal(expected if isinstance(expected, Bag) else Bag(expected))
+        print("%-14s %10.4f %14.4f %10.1f" % (label, t_bag, t_nested, t_nested / max(t_bag, 1e-9)))
+
+
+if __name__ == '__main__':
+    main()
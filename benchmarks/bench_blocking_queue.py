@@ -0,0 +1,82 @@
+# Author: Jin Huang
+# Description: Benchmark BlockingQueue throughput with N producer and M consumer threads,
+#              against a Queue shared under one lock (the wrapper BlockingQueue replaces)
+#              and the standard library's queue.Queue for reference.
+#              Run from the repository root: python benchmarks/bench_blocking_queue.py [ITEMS]
+
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blocking_queue import BlockingQueue
+from queue_dynamic_array import *
+
+CAPACITY = 1024
+
+
+class LockedQueue:
+    """
+    Queue behind a single mutex, polled by consumers: the pattern BlockingQueue replaces
+    """
+    def __init__(self):
+        self.queue = Queue()
+        self.lock = threading.Lock()
+
+    def put(self, value: object) -> None:
+        while True:
+            with self.lock:
+                if self.queue.size() < CAPACITY:
+                    self.queue.enqueue(value)
+                    return
+            time.sleep(0)
+
+    def get(self) -> object:
+        while True:
+            with self.lock:
+                if not self.queue.is_empty():
+                    return self.queue.dequeue()
+            time.sleep(0)
+
+
+def run(queue, producers: int, consumers: int, items: int) -> float:
+    """
+    Return items per second moved through queue by the given numbers of threads
+    """
+    per_producer = items // producers
+    total = per_producer * producers
+    per_consumer = [total // consumers + (1 if i < total % consumers else 0) for i in range(consumers)]
+
+    def produce() -> None:
+        for i in range(per_producer):
+            queue.put(i)
+
+    def consume(count: int) -> None:
+        for _ in range(count):
+            queue.get()
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    threads += [threading.Thread(target=consume, args=(count,)) for count in per_consumer]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return total / (time.perf_counter() - start)
+
+
+def main() -> None:
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(items, "items, capacity", CAPACITY, "- throughput in items / second")
+    print("%-10s %16s %16s %16s" % ("N x M", "BlockingQueue", "locked Queue", "queue.Queue"))
+    for producers, consumers in ((1, 1), (2, 2), (4, 4), (8, 2), (2, 8)):
+        blocking = run(BlockingQueue(CAPACITY), producers, consumers, items)
+        locked = run(LockedQueue(), producers, consumers, items)
+        standard = run(queue.Queue(CAPACITY), producers, consumers, items)
+        print("%-10s %16.0f %16.0f %16.0f" % ("%d x %d" % (producers, consumers), blocking, locked, standard))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# Author: Jin Huang
+# Description: Benchmark GapBuffer against DynamicArray for random, clustered (moving cursor)
+#              and append-only mixes of insert_at_index/remove_at_index.
+#              Run from the repository root: python benchmarks/bench_gap_buffer.py [N] [OPS]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dynamic_array import *
+from gap_buffer import GapBuffer
+
+
+def operations(kind: str, n: int, ops: int) -> list:
+    """
+    Return a list of (is_insert, index) pairs for a sequence that starts with n elements
+    """
+    rng = random.Random(1)
+    size, cursor, result = n, n // 2, []
+    for _ in range(ops):
+        is_insert = kind == 'append-only' or rng.random() < 0.6 or size == 0
+        if kind == 'random':
+            index = rng.randint(0, size) if is_insert else rng.randrange(size)
+        elif kind == 'clustered':
+            # edits stay within a few positions of a cursor that drifts slowly
+            cursor = min(max(cursor + rng.randint(-3, 3), 0), size - (0 if is_insert else 1))
+            index = cursor
+        else:
+            index = size
+        result.append((is_insert, index))
+        size += 1 if is_insert else -1
+    return result
+
+
+def run(seq, ops: list) -> float:
+    """
+    Return the wall time of applying ops to seq
+    """
+    start = time.perf_counter()
+    for is_insert, index in ops:
+        if is_insert:
+            seq.insert_at_index(index, index)
+        else:
+            seq.remove_at_index(index)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    ops_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    print("N =", n, "initial elements,", ops_count, "operations")
+    print("%-12s %14s %14s %8s" % ("mix", "DynamicArray s", "GapBuffer s", "ratio"))
+    for kind in ('random', 'clustered', 'append-only'):
+        ops = operations(kind, n, ops_count)
+        da, gb = DynamicArray(range(n)), GapBuffer(range(n))
+        t_da, t_gb = run(da, ops), run(gb, ops)
+        assert list(da) == list(gb)
+        print("%-12s %14.3f %14.3f %8.1f" % (kind, t_da, t_gb, t_da / t_gb))
+
+
+if __name__ == '__main__':
+    main()
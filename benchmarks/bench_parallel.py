@@ -0,0 +1,62 @@
+# Author: Jin Huang
+# Description: Benchmark parallel_map/parallel_reduce scaling in DynamicArray: wall time and
+#              speedup over map()/reduce() for a CPU-heavy function, for 1, 2, 4 and 8 workers.
+#              Run from the repository root: python benchmarks/bench_parallel.py [N]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dynamic_array import *
+
+WORK = 20_000
+
+
+def expensive(value: int) -> int:
+    """
+    CPU-heavy map function (module level, so the process pool can pickle it)
+    """
+    total = value
+    for i in range(WORK):
+        total = (total * 31 + i) % 1_000_003
+    return total
+
+
+def heavy_max(a: int, b: int) -> int:
+    """
+    CPU-heavy associative reduce function: burns the same work as expensive(), returns max(a, b)
+    """
+    expensive(b)
+    return max(a, b)
+
+
+def timed(func) -> tuple:
+    """
+    Return (result, wall time in seconds) of func()
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    da = DynamicArray(range(n), typecode='q')
+    print("N =", n, "elements,", os.cpu_count(), "CPUs")
+
+    expected_map, serial_map = timed(lambda: da.map(expensive))
+    expected_reduce, serial_reduce = timed(lambda: da.reduce(heavy_max))
+    print("%-8s %10s %8s %10s %8s" % ("workers", "map s", "speedup", "reduce s", "speedup"))
+    print("%-8s %10.2f %8s %10.2f %8s" % ("serial", serial_map, "1.00", serial_reduce, "1.00"))
+    for workers in (1, 2, 4, 8):
+        result, t_map = timed(lambda: da.parallel_map(expensive, workers=workers))
+        assert list(result) == list(expected_map)
+        result, t_reduce = timed(lambda: da.parallel_reduce(heavy_max, workers=workers))
+        assert result == expected_reduce
+        print("%-8d %10.2f %8.2f %10.2f %8.2f" % (workers, t_map, serial_map / t_map,
+                                                  t_reduce, serial_reduce / t_reduce))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# Author: Jin Huang
+# Description: Benchmark total drain time of Queue as it grows, against the original approach
+#              of dequeuing with DynamicArray.remove_at_index(0), to show linear versus quadratic cost.
+#              Run from the repository root: python benchmarks/bench_queue_drain.py [MAX_N]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from queue_dynamic_array import *
+
+SHIFTING_MAX = 12_500               # the shifting queue is quadratic: keep its runs short
+
+
+def drain_queue(n: int) -> float:
+    """
+    Return the time to dequeue n elements one by one from a Queue
+    """
+    queue = Queue()
+    for i in range(n):
+        queue.enqueue(i)
+    start = time.perf_counter()
+    while not queue.is_empty():
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+def drain_batch(n: int) -> float:
+    """
+    Return the time to empty a Queue of n elements with drain()
+    """
+    queue = Queue()
+    queue.enqueue_many(range(n))
+    start = time.perf_counter()
+    queue.drain()
+    return time.perf_counter() - start
+
+
+def drain_shifting(n: int) -> float:
+    """
+    Return the time to dequeue n elements the original way: front read, then remove_at_index(0)
+    """
+    da = DynamicArray(range(n))
+    start = time.perf_counter()
+    while not da.is_empty():
+        da.get_at_index(0)
+        da.remove_at_index(0)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    print("%-9s %12s %14s %12s %16s" % ("N", "dequeue s", "ns / element", "drain() s", "remove_at(0) s"))
+    n = max_n // 64
+    while n <= max_n:
+        t_queue, t_batch = drain_queue(n), drain_batch(n)
+        shifting = "%16.3f" % drain_shifting(n) if n <= SHIFTING_MAX else "%16s" % "-"
+        print("%-9d %12.3f %14.0f %12.3f %s" % (n, t_queue, t_queue / n * 1e9, t_batch, shifting))
+        n *= 2
+
+
+if __name__ == '__main__':
+    main()
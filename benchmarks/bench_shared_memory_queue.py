@@ -0,0 +1,67 @@
+# Author: Jin Huang
+# Description: Benchmark SharedMemoryQueue against multiprocessing.Queue: a child process puts
+#              N fixed-width '<dqi' records and the parent gets them (single producer / consumer).
+#              Run from the repository root: python benchmarks/bench_shared_memory_queue.py [N]
+
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared_memory_queue import SharedMemoryQueue
+
+RECORD = '<dqi'
+CAPACITY = 4096
+
+
+def produce_shared(queue: SharedMemoryQueue, n: int) -> None:
+    """
+    Child process: put n records into the shared memory queue
+    """
+    for i in range(n):
+        queue.put((i * 0.5, i, i & 0xffff))
+    queue.close()
+
+
+def produce_pickled(queue, n: int) -> None:
+    """
+    Child process: put n records (pickled tuples) into a multiprocessing.Queue
+    """
+    for i in range(n):
+        queue.put((i * 0.5, i, i & 0xffff))
+
+
+def transfer(queue, target, n: int, ctx) -> float:
+    """
+    Return records per second moved from a child process running target to this process
+    """
+    start = time.perf_counter()
+    child = ctx.Process(target=target, args=(queue, n))
+    child.start()
+    for _ in range(n):
+        queue.get()
+    child.join()
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(n, "records of", repr(RECORD), "- throughput in records / second")
+    print("%-12s %20s %22s" % ("start method", "SharedMemoryQueue", "multiprocessing.Queue"))
+    for method in ('fork', 'spawn'):
+        if method not in multiprocessing.get_all_start_methods():
+            continue
+        ctx = multiprocessing.get_context(method)
+        shared = SharedMemoryQueue(RECORD, CAPACITY, ctx=ctx)
+        try:
+            t_shared = transfer(shared, produce_shared, n, ctx)
+        finally:
+            shared.close()
+            shared.unlink()
+        t_pickled = transfer(ctx.Queue(CAPACITY), produce_pickled, n, ctx)
+        print("%-12s %20.0f %22.0f" % (method, t_shared, t_pickled))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# Author: Jin Huang
+# Description: Benchmark in-place shifting in DynamicArray: time per middle insert/remove,
+#              and the peak memory those calls allocate, measured with tracemalloc.
+#              Run from the repository root: python benchmarks/bench_shift.py [N]
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dynamic_array import *
+
+OPS = 100
+
+
+def middle_ops(da: DynamicArray) -> None:
+    """
+    Insert and then remove OPS values in the middle of da
+    """
+    for i in range(OPS):
+        da.insert_at_index(da.length() // 2, i)
+    for _ in range(OPS):
+        da.remove_at_index(da.length() // 2)
+
+
+def batch_ops(da: DynamicArray, run) -> None:
+    """
+    Insert run in the middle of da with insert_many(), then remove it with remove_range()
+    """
+    da.insert_many(da.length() // 2, run)
+    da.remove_range(da.length() // 2, len(run))
+
+
+def measure(func) -> tuple:
+    """
+    Return (seconds, peak bytes allocated) for one call of func().
+    The time is taken without tracemalloc, which slows Python code down a lot.
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    func()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print("N =", n, "elements,", OPS, "middle inserts then", OPS, "middle removes")
+    print("%-8s %-22s %12s %14s" % ("mode", "operation", "us / op", "peak bytes"))
+    for label, typecode in (("object", None), ("'q'", 'q')):
+        da = DynamicArray(range(n), typecode=typecode)
+        da.reserve(n + OPS)             # keep growth out of the measurement
+        elapsed, peak = measure(lambda: middle_ops(da))
+        print("%-8s %-22s %12.1f %14d" % (label, "insert/remove_at_index", elapsed / (2 * OPS) * 1e6, peak))
+
+        run = list(range(OPS)) if typecode is None else array(typecode, range(OPS))
+        elapsed, peak = measure(lambda: batch_ops(da, run))
+        print("%-8s %-22s %12.1f %14d" % (label, "insert_many/range", elapsed / 2 * 1e6, peak))
+    print("(peak bytes stay constant as N grows: the tail is shifted in place, no temporary arrays)")
+
+
+if __name__ == '__main__':
+    main()
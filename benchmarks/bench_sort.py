@@ -0,0 +1,51 @@
+# Author: Jin Huang
+# Description: Benchmark DynamicArray.sort() against copying to a list, sorting and rebuilding,
+#              for typed ('q') and object storage.
+#              Run from the repository root: python benchmarks/bench_sort.py [N]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dynamic_array import *
+
+
+def copy_and_rebuild(da: DynamicArray) -> DynamicArray:
+    """
+    The approach sort() replaces: copy to a list, sort it, build a new array with append()
+    """
+    values = [da.get_at_index(i) for i in range(da.length())]
+    values.sort()
+    new_arr = DynamicArray(typecode=da.typecode)
+    for value in values:
+        new_arr.append(value)
+    return new_arr
+
+
+def timed(func) -> tuple:
+    """
+    Return (result, wall time in seconds) of func()
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(1)
+    values = [rng.randint(-2**40, 2**40) for _ in range(n)]
+    print("N =", n, "random integers")
+    print("%-8s %12s %18s %8s" % ("mode", "sort() s", "copy+rebuild s", "ratio"))
+    for label, typecode in (("object", None), ("'q'", 'q')):
+        da = DynamicArray(values, typecode=typecode)
+        expected, t_rebuild = timed(lambda: copy_and_rebuild(da))
+        _, t_sort = timed(da.sort)
+        assert list(da) == list(expected)
+        print("%-8s %12.3f %18.3f %8.1f" % (label, t_sort, t_rebuild, t_rebuild / t_sort))
+
+
+if __name__ == '__main__':
+    main()
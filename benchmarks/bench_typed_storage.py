@@ -0,0 +1,60 @@
+# Author: Jin Huang
+# Description: Benchmark typed storage (typecode='d') against object storage in DynamicArray:
+#              memory held by N floats, and append / get_at_index / reduce throughput.
+#              Run from the repository root: python benchmarks/bench_typed_storage.py [N]
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dynamic_array import *
+
+
+def build(n: int, typecode) -> DynamicArray:
+    """
+    Return a Dynamic Array of n floats built with append()
+    """
+    da = DynamicArray(typecode=typecode)
+    for i in range(n):
+        da.append(i * 0.5)
+    return da
+
+
+def memory(n: int, typecode) -> int:
+    """
+    Return the bytes still allocated by a Dynamic Array of n floats
+    """
+    tracemalloc.start()
+    da = build(n, typecode)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del da
+    return used
+
+
+def timed(func) -> float:
+    """
+    Return the wall time of func() in seconds
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print("N =", n)
+    print("%-8s %12s %10s %10s %10s" % ("mode", "memory MB", "append s", "index s", "reduce s"))
+    for label, typecode in (("object", None), ("'d'", 'd')):
+        mem = memory(n, typecode)
+        da = build(n, typecode)
+        t_append = timed(lambda: build(n, typecode))
+        t_index = timed(lambda: [da.get_at_index(i) for i in range(n)])
+        t_reduce = timed(lambda: da.reduce(lambda a, b: a + b))
+        print("%-8s %12.1f %10.3f %10.3f %10.3f" % (label, mem / 1e6, t_append, t_index, t_reduce))
+
+
+if __name__ == '__main__':
+    main()
@@ -12,6 +12,7 @@ from static_array import *
 def binary_search(arr: StaticArray, target: int) -> int:
     """
     Receives a sorted StaticArray and an integer target.
+    Any object with size()/get() works too, e.g. DynamicArray.sorted_view().
     If target exists, returns the index of target.
     Otherwise, returns -1.
     Runtimecomplexity O(logN)
@@ -0,0 +1,91 @@
+# Author: Jin Huang
+# Description: Implement a bounded, thread-safe BlockingQueue for multi-threaded
+#              producers and consumers, using a fixed circular buffer.
+
+from threading import Condition, Lock
+from queue_dynamic_array import *
+
+
+class BlockingQueue:
+    def __init__(self, capacity: int):
+        """
+        Init new bounded blocking queue holding at most capacity elements
+        One mutex guards the buffer and both counters; producers wait on not_full and consumers
+        on not_empty, two conditions sharing that mutex (the layout of the standard queue.Queue).
+        Each put or get notifies at most one waiter of the other side.
+        """
+        if capacity <= 0:
+            raise QueueException
+        self.capacity = capacity
+        self.sa = StaticArray(capacity)
+        self.put_count = 0              # total puts so far; next slot written is put_count % capacity
+        self.get_count = 0              # total gets so far; next slot read is get_count % capacity
+        self.mutex = Lock()
+        self.not_full = Condition(self.mutex)
+        self.not_empty = Condition(self.mutex)
+
+    def __str__(self):
+        """
+        Return a summary of the queue in human-readable form
+        """
+        return "BLOCKING_QUEUE: " + str(self.size()) + "/" + str(self.capacity) + " elements."
+
+    def is_empty(self) -> bool:
+        """
+        Return True is the queue is empty, False otherwise (a snapshot under concurrency)
+        """
+        return self.size() == 0
+
+    def is_full(self) -> bool:
+        """
+        Return True is the queue is full, False otherwise (a snapshot under concurrency)
+        """
+        return self.size() >= self.capacity
+
+    def size(self) -> int:
+        """
+        Return number of elements currently in the queue (a snapshot under concurrency)
+        """
+        with self.mutex:
+            return self.put_count - self.get_count
+
+    # -----------------------------------------------------------------------
+
+    def put(self, value: object, block: bool = True, timeout: float = None) -> None:
+        """
+        Adds a new value to the end of the queue.
+        If the queue is full, waits for a free slot (at most timeout seconds if given).
+        If no slot frees up in time, or the queue is full and block is False: raises "QueueException".
+        """
+        with self.not_full:
+            if self.put_count - self.get_count >= self.capacity:
+                if not block:
+                    raise QueueException
+                if not self.not_full.wait_for(lambda: self.put_count - self.get_count < self.capacity,
+                                              timeout):
+                    raise QueueException
+            self.sa[self.put_count % self.capacity] = value
+            self.put_count += 1
+            self.not_empty.notify()
+
+        return self
+
+    def get(self, block: bool = True, timeout: float = None) -> object:
+        """
+        Removes and returns the value at the beginning of the queue.
+        If the queue is empty, waits for a value (at most timeout seconds if given).
+        If none arrives in time, or the queue is empty and block is False: raises "QueueException".
+        """
+        with self.not_empty:
+            if self.put_count == self.get_count:
+                if not block:
+                    raise QueueException
+                if not self.not_empty.wait_for(lambda: self.put_count != self.get_count, timeout):
+                    raise QueueException
+            index = self.get_count % self.capacity
+            value = self.sa[index]
+            self.sa[index] = None
+            self.get_count += 1
+            self.not_full.notify()
+
+        return value
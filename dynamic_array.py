@@ -1,7 +1,21 @@
 # Author: Jin Huang
 # Description: Implement a Dynamic Array class using StaticArray objects.
 
+from array import array, typecodes
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, islice
+from math import ceil
+from mmap import mmap, ACCESS_READ, ACCESS_WRITE
+from os import cpu_count
 from static_array import *
+import pickle
+import struct
+import sys
+
+try:
+    import numpy as np
+except ImportError:         # NumPy is optional: map/filter/reduce fall back to the scalar loop
+    np = None
 
 
 class DynamicArrayException(Exception):
@@ -11,20 +25,224 @@ class DynamicArrayException(Exception):
     pass
 
 
+def _as_ndarray(da) -> object:
+    """
+    Return a zero-copy NumPy array over the live elements of a typed Dynamic Array,
+    or None if NumPy is unavailable, the array is empty or uses object storage
+    """
+    if np is None or da.typecode is None or da.size == 0:
+        return None
+    try:
+        dtype = np.dtype(da.typecode)
+    except TypeError:
+        return None
+    if dtype.itemsize != da.data.itemsize:
+        return None
+    return np.frombuffer(da.data, dtype=dtype, count=da.size)
+
+
+def _from_ndarray(values) -> object:
+    """
+    Build a Dynamic Array from a 1-d NumPy array, keeping a typed buffer
+    whenever the dtype has a matching array module typecode
+    """
+    char = values.dtype.char
+    if char in typecodes and array(char).itemsize == values.dtype.itemsize:
+        new_arr = DynamicArray(typecode=char)
+        new_arr.data = array(char, values.tobytes())
+        new_arr.size = len(values)
+        new_arr.capacity = max(new_arr.size, 1)
+        return new_arr
+    return DynamicArray(values.tolist())
+
+
+def _vectorizable(func, vectorize: bool, nin: int) -> bool:
+    """
+    Return True if func should be applied to a whole NumPy buffer at once.
+    Only when the caller opted in with vectorize=True: NumPy ufuncs taking nin arguments,
+    and other callables for the unary (map/filter) case.
+    """
+    if not vectorize or np is None:
+        return False
+    if isinstance(func, np.ufunc):
+        return func.nin == nin
+    return nin == 1
+
+
+def _widened(buf) -> object:
+    """
+    Return buf converted to 64-bit elements of its kind (int64, float64; uint64 is kept),
+    so vectorized arithmetic matches the scalar loop unless it overflows 64 bits
+    """
+    if buf.dtype.kind == 'f':
+        return buf.astype(np.float64, copy=False)
+    if buf.dtype == np.uint64:
+        return buf
+    return buf.astype(np.int64, copy=False)
+
+
+def _map_chunk(map_func, typecode, payload) -> list:
+    """
+    Process pool worker: apply map_func to one chunk shipped by parallel_map()
+    """
+    values = payload if typecode is None else array(typecode, payload)
+    return [map_func(value) for value in values]
+
+
+def _reduce_chunk(reduce_func, typecode, payload) -> object:
+    """
+    Process pool worker: fold one non-empty chunk shipped by parallel_reduce()
+    """
+    values = iter(payload if typecode is None else array(typecode, payload))
+    result = next(values)
+    for value in values:
+        result = reduce_func(result, value)
+    return result
+
+
+# dump()/load() layout: 16-byte header (magic, version, typecode or NUL for objects,
+# byte order, item size or 0 for objects, element count), then raw elements or length-prefixed pickles
+_DUMP_HEADER = struct.Struct('<4sBcBBQ')
+_DUMP_MAGIC = b'DYNS'
+_DUMP_VERSION = 1
+_DUMP_LENGTH = struct.Struct('<Q')
+_DUMP_CHUNK = 1 << 20
+
+
+def _read_exact(fileobj, size: int) -> bytes:
+    """
+    Read exactly size bytes, raising DynamicArrayException on a truncated stream.
+    Large sizes are read in chunks, so a corrupt length fails at the end of the data
+    instead of allocating size bytes up front.
+    """
+    data = fileobj.read(min(size, _DUMP_CHUNK))
+    if len(data) == size:
+        return data
+    parts = [data]
+    remaining = size - len(data)
+    while remaining > 0 and data:
+        data = fileobj.read(min(remaining, _DUMP_CHUNK))
+        parts.append(data)
+        remaining -= len(data)
+    if remaining > 0:
+        raise DynamicArrayException
+    return b''.join(parts)
+
+
+class FactorGrowth:
+    """
+    Growth policy: multiply capacity by factor (2 doubles, 1.5 grows by half)
+    """
+    def __init__(self, factor: float = 2):
+        if factor <= 1:
+            raise DynamicArrayException
+        self.factor = factor
+
+    def grow(self, capacity: int, required: int) -> int:
+        """
+        Return the new capacity for storage that must hold at least required elements
+        """
+        return max(required, int(capacity * self.factor))
+
+
+class IncrementGrowth:
+    """
+    Growth policy: add a fixed number of slots on every resize
+    """
+    def __init__(self, step: int):
+        if step <= 0:
+            raise DynamicArrayException
+        self.step = step
+
+    def grow(self, capacity: int, required: int) -> int:
+        """
+        Return the new capacity for storage that must hold at least required elements
+        """
+        return max(required, capacity + self.step)
+
+
+class CappedGrowth:
+    """
+    Growth policy: multiply capacity by factor, but never add more than max_step slots at once
+    """
+    def __init__(self, factor: float = 2, max_step: int = 1 << 20):
+        if factor <= 1 or max_step <= 0:
+            raise DynamicArrayException
+        self.factor = factor
+        self.max_step = max_step
+
+    def grow(self, capacity: int, required: int) -> int:
+        """
+        Return the new capacity for storage that must hold at least required elements
+        """
+        step = min(int(capacity * (self.factor - 1)), self.max_step)
+        return max(required, capacity + max(step, 1))
+
+
+class QuarterShrink:
+    """
+    Shrink policy: once fewer than 1/4 of the slots are used, reduce capacity
+    to twice the element count, never below minimum (the original rule)
+    """
+    def __init__(self, minimum: int = 10):
+        self.minimum = minimum
+
+    def shrink(self, size: int, capacity: int) -> int:
+        """
+        Return the reduced capacity, or None if the storage should be kept
+        """
+        if size < capacity * 0.25 and capacity > self.minimum:
+            return max(size * 2, self.minimum)
+        return None
+
+
+class HysteresisShrink:
+    """
+    Shrink policy: reduce capacity only once the load factor drops below low,
+    and then only down to a load factor of target, never below minimum.
+    Keeping low well under target stops a push/pop pattern from resizing on every call.
+    """
+    def __init__(self, low: float = 0.125, target: float = 0.5, minimum: int = 10):
+        if not 0 < low < target <= 1:
+            raise DynamicArrayException
+        self.low = low
+        self.target = target
+        self.minimum = minimum
+
+    def shrink(self, size: int, capacity: int) -> int:
+        """
+        Return the reduced capacity, or None if the storage should be kept
+        """
+        if size < capacity * self.low and capacity > self.minimum:
+            return max(ceil(size / self.target), self.minimum)
+        return None
+
+
 class DynamicArray:
-    def __init__(self, start_array=None):
+    def __init__(self, start_array=None, typecode=None, growth=None, shrink=None):
         """
         Initialize new dynamic array
+        If typecode is given (any array module typecode, e.g. 'd' or 'q'),
+        elements are stored unboxed in a contiguous machine-typed buffer
+        instead of a StaticArray of Python objects.
+        growth and shrink are resize policies (default: FactorGrowth(2) and QuarterShrink()).
+        resize_count and copied_count record how many resizes happened and how many elements they copied.
         """
+        if typecode is not None and typecode not in typecodes:
+            raise DynamicArrayException
+        self.typecode = typecode
+        self.growth = growth if growth is not None else FactorGrowth()
+        self.shrink = shrink if shrink is not None else QuarterShrink()
+        self.resize_count = 0
+        self.copied_count = 0
         self.size = 0
         self.capacity = 4
-        self.data = StaticArray(self.capacity)
+        self.data = self._new_storage(self.capacity)
+        self._shared = False                        # storage is also referenced by a snapshot
 
         # populate dynamic array with initial values (if provided)
-        # before using this feature, implement append() method
         if start_array is not None:
-            for value in start_array:               # read value in start_array one by one
-                self.append(value)
+            self.extend(start_array)
 
     def __str__(self) -> str:
         """
@@ -51,6 +269,7 @@ class DynamicArray:
         """
         if index < 0 or index >= self.size:
             raise DynamicArrayException
+        self._before_write()
         self.data[index] = value
 
     def __getitem__(self, index) -> object:
@@ -67,6 +286,14 @@ class DynamicArray:
         """
         self.set_at_index(index, value)
 
+    def __iter__(self):
+        """
+        Iterate over the stored values in index order
+        """
+        data = self.data
+        for i in range(self.size):
+            yield data[i]
+
     def is_empty(self) -> bool:
         """
         Return True if array is empty / False otherwise
@@ -79,6 +306,53 @@ class DynamicArray:
         """
         return self.size
 
+    def _new_storage(self, capacity: int) -> object:
+        """
+        Return an empty backing store with room for capacity elements:
+        a StaticArray in object mode, a zero-filled array in typed mode
+        """
+        if self.typecode is None:
+            return StaticArray(capacity)
+        return array(self.typecode, bytes(capacity * array(self.typecode).itemsize))
+
+    def _new_like(self) -> object:
+        """
+        Return a new empty Dynamic Array using the same storage mode and resize policies
+        """
+        return DynamicArray(typecode=self.typecode, growth=self.growth, shrink=self.shrink)
+
+    def _before_write(self) -> None:
+        """
+        Copy-on-write: if a snapshot shares the storage, give this array its own copy
+        before an existing element is overwritten. Writes past the end (append/extend) never
+        touch what a snapshot can see, so they do not need this.
+        """
+        if not self._shared:
+            return
+        old_data = self.data
+        self.data = self._new_storage(self.capacity)
+        self._shared = False
+        if self.typecode is not None:
+            self.data[:self.size] = old_data[:self.size]
+        else:
+            for i in range(self.size):
+                self.data[i] = old_data[i]
+
+    def _grow(self, required: int) -> None:
+        """
+        Resize according to the growth policy if required elements do not fit
+        """
+        if required > self.capacity:
+            self.resize(self.growth.grow(self.capacity, required))
+
+    def _reduce(self) -> None:
+        """
+        Resize according to the shrink policy if it asks for less storage
+        """
+        new_capacity = self.shrink.shrink(self.size, self.capacity)
+        if new_capacity is not None and new_capacity < self.capacity:
+            self.resize(new_capacity)
+
     # -----------------------------------------------------------------------
 
     def resize(self, new_capacity: int) -> None:
@@ -89,12 +363,22 @@ class DynamicArray:
         old_data = self.data
         if new_capacity is None:
             self.capacity = self.capacity * 2
-            self.data = StaticArray(self.capacity)
+            self.data = self._new_storage(self.capacity)
         elif new_capacity > 0 and new_capacity >= self.size:
             self.capacity = new_capacity
-            self.data = StaticArray(self.capacity)
+            self.data = self._new_storage(self.capacity)
+        else:
+            return self
+
+        self._shared = False
+        self.resize_count += 1
+        self.copied_count += self.size
 
         # copy from old to new
+        if self.typecode is not None:
+            self.data[:self.size] = old_data[:self.size]
+            return self
+
         start_index = 0
         for i in range(self.size):
             old_value = old_data.__getitem__(i)
@@ -107,86 +391,110 @@ class DynamicArray:
     def append(self, value: object) -> None:
         """
         Adds a new value at the end of the dynamic array.
-        If the storage is full, double the capacity, then add new a new value.
+        If the storage is full, grow it by the growth policy (doubling by default), then add new a new value.
         """
         starting_index = self.size
         if self.size == self.capacity:
-            double_capacity = self.capacity * 2
-            self.resize(double_capacity)
+            self._grow(self.size + 1)
 
+        # store first: in typed mode a value of the wrong type raises here, leaving size unchanged
+        self.data[starting_index] = value
         self.size += 1
-        self.set_at_index(starting_index, value)
 
         return self.data
 
 
 
+    def _shift(self, src: int, dst: int, count: int) -> None:
+        """
+        Moves count elements starting at src so they start at dst, in place.
+        Overlapping ranges are handled; no temporary array is allocated.
+        """
+        if count <= 0 or src == dst:
+            return
+
+        if self.typecode is not None:
+            # memoryview slice assignment is a single memmove on the raw buffer
+            with memoryview(self.data) as buf:
+                buf[dst:dst + count] = buf[src:src + count]
+            return
+
+        data = self.data
+        if dst > src:
+            # shifting right: copy from the back so nothing is overwritten early
+            for i in range(count - 1, -1, -1):
+                data[dst + i] = data[src + i]
+        else:
+            for i in range(count):
+                data[dst + i] = data[src + i]
+
+    def _clear_slots(self, start: int, end: int) -> None:
+        """
+        Drops references held by unused slots [start, end) of object storage
+        """
+        if self.typecode is None:
+            for i in range(start, end):
+                self.data[i] = None
+
     def insert_at_index(self, index: int, value: object) -> None:
         """
         Adds a new value at the specified index position in the dynamic array.
         If index invalid: raises a "DynamicArrayException".
-        If storage is full, double the dynamic array's capacity, then add a new value.
+        If storage is full, grow it by the growth policy (doubling by default), then add a new value.
+        The tail is shifted in place: O(N - index), no temporary arrays.
         """
-
-        # # insert at the last index: append
-        # if index == self.size -1 and index != 0:
-        #     self.append(value)
-        #     return self.data
-
-        if index < 0:
+        if index < 0 or index > self.size:
             raise DynamicArrayException
 
-        if self.size != 0 and index > self.size:
-            raise DynamicArrayException
+        if self.size == self.capacity:
+            self._grow(self.size + 1)
+
+        self._before_write()
+        self._shift(index, index + 1, self.size - index)
+        try:
+            self.data[index] = value
+        except (TypeError, OverflowError):
+            # typed storage rejected the value: move the tail back so the array is unchanged
+            self._shift(index + 1, index, self.size - index)
+            raise
+        self.size += 1
 
-        # index out of boundary
-        arr_boundary = self.size + 1
-        if index >= arr_boundary:
-            raise DynamicArrayException
+        return self.data
 
 
-        # empty array
-        if self.size == 0:
-            self.size += 1
-            self.set_at_index(0, value)
-            return self.data
+    def insert_many(self, index: int, values) -> None:
+        """
+        Inserts all values (iterable or Dynamic Array) starting at the specified index position.
+        The tail is shifted once for the whole run and storage grows at most once.
+        If index invalid: raises a "DynamicArrayException".
+        """
+        if index < 0 or index > self.size:
+            raise DynamicArrayException
 
-        # insert at the end of array
-        if index == self.size:
-            self.append(value)
+        if isinstance(values, DynamicArray):
+            values = list(islice(values.data, values.size))
+        elif not hasattr(values, '__len__'):
+            values = list(values)
+        if self.typecode is not None and not (isinstance(values, array) and values.typecode == self.typecode):
+            # convert before shifting, so a value the buffer rejects leaves the array unchanged
+            values = array(self.typecode, values)
+        count = len(values)
+        if count == 0:
             return self.data
 
-        if self.size == self.capacity:
-            double_capacity = self.capacity * 2
-            self.resize(double_capacity)
-
-        # copy old value starting from index
-        temp_arr = StaticArray(self.size)
-        temp_arr_index = 0
-        temp_arr_counter = 0
-        for i in range(index, self.size):
-            temp = self.get_at_index(i)
-            if temp is not None:
-                temp_arr.__setitem__(temp_arr_index, temp)
-                temp_arr_index += 1
-                temp_arr_counter += 1
-        final_temp_arr = StaticArray(temp_arr_counter)
-        final_temp_index = 0
-        for i in range(temp_arr_counter):
-            temp_val = temp_arr.__getitem__(i)
-            final_temp_arr.set(final_temp_index, temp_val)
-            final_temp_index += 1
-
-        # insert value at index
-        self.set_at_index(index, value)
+        required = self.size + count
+        self._grow(required)
 
-        # copy the rest to the array
-        starting_index = index+1
-        self.size += 1
-        for i in range(final_temp_arr.size()):
-            arr_val = final_temp_arr.__getitem__(i)
-            self.set_at_index(starting_index, arr_val)
-            starting_index += 1
+        self._before_write()
+        self._shift(index, index + count, self.size - index)
+        data = self.data
+        if self.typecode is not None:
+            data[index:index + count] = values
+        else:
+            for value in values:
+                data[index] = value
+                index += 1
+        self.size = required
 
         return self.data
 
@@ -196,61 +504,277 @@ class DynamicArray:
         Removes the element at the specified index position.
         If invlaid index: raises DynamicArrayException
         Valid indices: [0, N-1]
+        Before removal the shrink policy may reduce capacity; by default (QuarterShrink):
         If elements before removal < 1/4 of current capacity:
             Reduction: Capacity reduced to 2 * current elements (before removal)
                 If current capacity (before reduction) <= 10:
                     No reduction
                 If current capacity (before reduction) > 10:
                     Reduced capacity must remain >= 10
+        The tail is shifted in place: O(N - index), no temporary arrays.
         """
         # out of boundary
         if index >= self.size or index < 0:
             raise DynamicArrayException
 
         # Reduction
-        if self.size < self.capacity * 0.25:
-            if self.capacity <= 10:
-                pass
-            elif self.capacity > 10:
-                if self.size * 2 < 10:
-                    self.resize(10)
-                else:
-                    self.resize(self.size * 2)
-
-        # remove the last element
-        if index == self.size - 1:
-            self.size -= 1
-            return self.data
+        self._reduce()
 
-        # copy old values
-        temp_arr = StaticArray(self.size - 1)
-        temp_arr_index = 0
-        temp_counter = 0
-        for i in range(index+1, self.size):
-            val = self.get_at_index(i)
-            temp_arr.__setitem__(temp_arr_index, val)
-            temp_arr_index += 1
-            temp_counter += 1
+        self._before_write()
+        self._shift(index + 1, index, self.size - index - 1)
+        self.size -= 1
+        self._clear_slots(self.size, self.size + 1)
 
-        final_temp_arr = StaticArray(temp_counter)
-        final_temp_index = 0
-        for i in range(final_temp_arr.size()):
-            temp_val = temp_arr.get(i)
-            final_temp_arr.set(final_temp_index, temp_val)
-            final_temp_index += 1
+        return self.data
 
 
-        # update the dynamic array
-        self.size -= 1
-        da_index = index
-        for i in range(final_temp_arr.size()):
-            new_val = final_temp_arr.get(i)
-            self.set_at_index(da_index, new_val)
-            da_index += 1
+    def remove_range(self, start_index: int, count: int) -> None:
+        """
+        Removes count elements starting at start_index, shifting the tail once.
+        If the range is invalid: raises DynamicArrayException.
+        Afterwards the shrink policy is applied, as in remove_at_index().
+        """
+        if start_index < 0 or count < 0 or start_index + count > self.size:
+            raise DynamicArrayException
+        if count == 0:
+            return self.data
+
+        old_size = self.size
+        self._before_write()
+        self._shift(start_index + count, start_index, old_size - start_index - count)
+        self.size -= count
+        self._clear_slots(self.size, old_size)
+
+        # Reduction
+        self._reduce()
 
         return self.data
 
 
+    def _batch(self, values) -> object:
+        """
+        Return values (Dynamic Array, list, typed buffer or iterable) as a sized sequence
+        """
+        if isinstance(values, DynamicArray):
+            if values.typecode is not None:
+                return values.data[:values.size]
+            return list(values)
+        if not hasattr(values, '__len__') or not hasattr(values, '__getitem__'):
+            return list(values)
+        return values
+
+    def _check_indices(self, indices) -> object:
+        """
+        Return indices as a sized sequence after validating all of them with one min/max pass
+        Any index outside [0, N-1] raises DynamicArrayException.
+        """
+        indices = self._batch(indices)
+        if len(indices) > 0 and (min(indices) < 0 or max(indices) >= self.size):
+            raise DynamicArrayException
+        return indices
+
+    def get_many(self, indices) -> object:
+        """
+        Gathers the values at the given index positions (Dynamic Array, list or typed buffer of ints)
+        into a new Dynamic Array using the same storage mode.
+        Bounds are validated once for the whole batch; invalid index raises DynamicArrayException.
+        """
+        indices = self._check_indices(indices)
+        data = self.data
+        new_arr = self._new_like()
+        new_arr.extend([data[i] for i in indices])
+
+        return new_arr
+
+    def set_many(self, indices, values) -> None:
+        """
+        Scatters values to the given index positions: self[indices[k]] = values[k].
+        Bounds are validated once for the whole batch; invalid index
+        or a length mismatch raises DynamicArrayException.
+        """
+        indices = self._check_indices(indices)
+        values = self._batch(values)
+        if len(values) != len(indices):
+            raise DynamicArrayException
+        if self.typecode is not None and not (isinstance(values, array) and values.typecode == self.typecode):
+            # convert before writing, so a value the buffer rejects leaves the array unchanged
+            values = array(self.typecode, values)
+
+        self._before_write()
+        data = self.data
+        for i, value in zip(indices, values):
+            data[i] = value
+
+        return self
+
+    def select(self, mask) -> object:
+        """
+        Returns a new Dynamic Array (same storage mode) with the values whose mask entry is true.
+        The mask must have exactly one entry per element, or DynamicArrayException is raised.
+        """
+        mask = self._batch(mask)
+        if len(mask) != self.size:
+            raise DynamicArrayException
+
+        new_arr = self._new_like()
+        new_arr.extend(list(compress(islice(self.data, self.size), mask)))
+
+        return new_arr
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """
+        Sorts the array in place, stably, with the same key and reverse arguments as list.sort().
+        Without a key, typed storage is sorted directly in its buffer by NumPy when it is installed.
+        Otherwise the live elements are sorted by Python's built-in (C) sort and written back:
+        typed storage with one slice assignment, object storage in a single pass.
+        """
+        n = self.size
+        if n < 2:
+            return self
+
+        self._before_write()
+        if self.typecode is not None:
+            buf = _as_ndarray(self) if key is None else None
+            if buf is not None:
+                # reversing before and after an ascending stable sort keeps equal elements
+                # in their original order, as list.sort(reverse=True) does
+                if reverse:
+                    buf[:] = buf[::-1]
+                buf.sort(kind='stable')
+                if reverse:
+                    buf[:] = buf[::-1]
+                del buf                 # release the buffer export so the array can resize again
+                return self
+            self.data[:n] = array(self.typecode, sorted(islice(self.data, n), key=key, reverse=reverse))
+            return self
+
+        data = self.data
+        values = list(islice(data, n))
+        values.sort(key=key, reverse=reverse)
+        for i, value in enumerate(values):
+            data[i] = value
+
+        return self
+
+    def is_sorted(self, key=None, reverse: bool = False) -> bool:
+        """
+        Return True if the values are in ascending order (descending if reverse=True)
+        """
+        data = self.data
+        prev = None
+        for i in range(self.size):
+            current = data[i] if key is None else key(data[i])
+            if i > 0 and (prev < current if reverse else current < prev):
+                return False
+            prev = current
+        return True
+
+    def sorted_view(self) -> object:
+        """
+        Returns a DynamicArrayView over the whole (sorted) array that also offers the
+        StaticArray-style size()/get() accessors, so binary_search() can search it directly.
+        If the array is not sorted in ascending order: raises DynamicArrayException.
+        """
+        if not self.is_sorted():
+            raise DynamicArrayException
+        return self.view(0, self.size)
+
+    def dump(self, fileobj, chunk_size: int = _DUMP_CHUNK) -> None:
+        """
+        Writes the array to a binary file object in a compact format (see load()).
+        Typed arrays are written as a header plus the raw buffer, streamed in slices of
+        chunk_size bytes straight from storage, so no second in-memory copy is made.
+        Object arrays are written as one length-prefixed pickle per element.
+        """
+        typecode = b'\0' if self.typecode is None else self.typecode.encode()
+        itemsize = 0 if self.typecode is None else self.data.itemsize
+        byteorder = 0 if sys.byteorder == 'little' else 1
+        fileobj.write(_DUMP_HEADER.pack(_DUMP_MAGIC, _DUMP_VERSION, typecode, byteorder, itemsize, self.size))
+
+        if self.typecode is not None:
+            with memoryview(self.data) as buf, buf.cast('B') as raw:
+                end = self.size * buf.itemsize
+                for start in range(0, end, chunk_size):
+                    fileobj.write(raw[start:min(start + chunk_size, end)])
+            return self
+
+        out = bytearray()
+        for i in range(self.size):
+            payload = pickle.dumps(self.data[i], pickle.HIGHEST_PROTOCOL)
+            out += _DUMP_LENGTH.pack(len(payload))
+            out += payload
+            if len(out) >= chunk_size:
+                fileobj.write(out)
+                out.clear()
+        fileobj.write(out)
+
+        return self
+
+    @staticmethod
+    def load(fileobj, chunk_size: int = _DUMP_CHUNK) -> object:
+        """
+        Reads an array written by dump() from a binary file object and returns a new Dynamic Array.
+        Typed data is read directly into the new array's buffer, chunk by chunk.
+        A malformed or truncated stream raises DynamicArrayException.
+        Object arrays are unpickled, so only load files from trusted sources.
+        """
+        header = _read_exact(fileobj, _DUMP_HEADER.size)
+        magic, version, typecode, byteorder, itemsize, count = _DUMP_HEADER.unpack(header)
+        if magic != _DUMP_MAGIC or version != _DUMP_VERSION:
+            raise DynamicArrayException
+
+        if typecode == b'\0':
+            new_arr = DynamicArray()
+            for _ in range(count):
+                length, = _DUMP_LENGTH.unpack(_read_exact(fileobj, _DUMP_LENGTH.size))
+                new_arr.append(pickle.loads(_read_exact(fileobj, length)))
+            return new_arr
+
+        typecode = typecode.decode('latin-1')
+        # the item size of 'l'/'L' differs between platforms: refuse data written with another one
+        if typecode not in typecodes or itemsize != array(typecode).itemsize:
+            raise DynamicArrayException
+        # the count comes from the stream, so storage grows as data arrives rather than up front:
+        # a corrupt header fails with a short read, not a huge allocation
+        new_arr = DynamicArray(typecode=typecode)
+        per_chunk = max(chunk_size // itemsize, 1)
+        while new_arr.size < count:
+            step = min(per_chunk, count - new_arr.size)
+            new_arr._grow(new_arr.size + step)
+            with memoryview(new_arr.data) as buf, buf.cast('B') as raw:
+                pos = new_arr.size * itemsize
+                end = pos + step * itemsize
+                while pos < end:
+                    read = fileobj.readinto(raw[pos:end])
+                    if not read:
+                        raise DynamicArrayException
+                    pos += read
+            new_arr.size += step
+        if byteorder != (0 if sys.byteorder == 'little' else 1):
+            new_arr.data.byteswap()
+
+        return new_arr
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Ensures the storage can hold at least capacity elements without further resizing
+        """
+        if capacity > self.capacity:
+            self.resize(capacity)
+
+        return self
+
+
+    def shrink_to_fit(self) -> None:
+        """
+        Reduces capacity to the number of stored elements (at least 1)
+        """
+        if self.capacity > max(self.size, 1):
+            self.resize(max(self.size, 1))
+
+        return self
+
+
     def slice(self, start_index: int, size: int) -> object:
         """
         Returns a new Dynamic Array object that contains the requested number of elements from the original array.
@@ -274,7 +798,7 @@ class DynamicArray:
         if end_index > self.size:
             raise DynamicArrayException
 
-        new_arr = DynamicArray()
+        new_arr = self._new_like()
 
         # use the append method to construct a new dynamic array
         for i in range(start_index, end_index):
@@ -283,23 +807,128 @@ class DynamicArray:
 
         return new_arr
 
+    def view(self, start_index: int, size: int) -> object:
+        """
+        Returns a DynamicArrayView: a read/write window of size elements starting at start_index
+        that shares this array's storage instead of copying it.
+        If start index or size is invalid or if not enough elements:
+            Raises DynamicArrayException.
+        """
+        if size < 0 or start_index < 0 or start_index + size > self.size:
+            raise DynamicArrayException
+
+        return DynamicArrayView(self, start_index, size)
+
+    def snapshot(self) -> object:
+        """
+        Returns an immutable DynamicArraySnapshot of the current contents in O(1).
+        The snapshot shares this array's storage; the array copies it only when one of the
+        elements the snapshot can see is later overwritten, inserted before or removed.
+        Appends and resizes never disturb a snapshot.
+        """
+        self._shared = True
+        return DynamicArraySnapshot(self.data, self.size, self.typecode)
+
+    def stream(self) -> object:
+        """
+        Returns a lazy DynamicArrayStream over the array's values, so that chained
+        map/filter/take stages run in a single pass without intermediate arrays
+        """
+        return DynamicArrayStream(iter(self))
+
     def merge(self, second_da: object) -> None:
         """
         Takes another Dynamic Array and appends all elements to the current array.
         """
-        second_da_index = 0
-        for i in range(second_da.size):
-            second_da_value = second_da.get_at_index(i)
-            self.append(second_da_value)
+        return self.extend(second_da)
+
+
+    def extend(self, values) -> object:
+        """
+        Appends every value from an iterable (or another Dynamic Array) to the end of the array.
+        If the number of values is known up front, the storage is resized at most once
+        and the values are copied in a single pass.
+        Generators are consumed in chunks, growing the storage once per chunk.
+        """
+        if isinstance(values, DynamicArray):
+            count = values.size
+            if self.typecode is not None and values.typecode == self.typecode:
+                values = values.data[:count]
+            else:
+                values = islice(values.data, count)
+        elif hasattr(values, '__len__'):
+            count = len(values)
+        else:
+            # unknown length: consume in chunks sized to the current capacity
+            values = iter(values)
+            while True:
+                chunk = list(islice(values, max(self.capacity, 1024)))
+                if not chunk:
+                    return self
+                self.extend(chunk)
+
+        if count == 0:
+            return self
+
+        required = self.size + count
+        self._grow(required)
+
+        index = self.size
+        data = self.data
+
+        # typed buffers of the same typecode are copied with one block move
+        if self.typecode is not None and isinstance(values, array) and values.typecode == self.typecode:
+            data[index:required] = values
+            self.size = required
+            return self
+
+        for value in values:
+            data[index] = value
+            index += 1
+        self.size = index
 
         return self
 
 
-    def map(self, map_func) -> object:
+    @classmethod
+    def from_iterable(cls, values, typecode=None) -> object:
+        """
+        Builds a new Dynamic Array from an iterable with a single bulk extend
+        """
+        new_arr = cls(typecode=typecode)
+        new_arr.extend(values)
+        return new_arr
+
+
+    @staticmethod
+    def open(path: str, typecode=None, mode: str = 'r') -> object:
+        """
+        Opens a typed Dynamic Array stored in a memory-mapped file (see MappedDynamicArray).
+        mode 'r' maps an existing file read-only, 'r+' maps it read-write,
+        'w+' creates (or truncates) the file and requires a typecode.
+        """
+        return MappedDynamicArray(path, typecode, mode)
+
+
+    def map(self, map_func, vectorize: bool = False) -> object:
         """
         Creates a new Dynamic Array, where the value of each element is derived by applying a given map_func
         to the corresponding value from the original array.
+        map_func may return any type, so the new array always uses object storage.
+        With vectorize=True, for typed arrays with NumPy installed, map_func (a unary NumPy ufunc or
+        any callable) is applied to the whole buffer at once and the result keeps a typed buffer.
+        The buffer is first widened to 64-bit elements, so results match the scalar loop
+        unless they overflow 64 bits. Callables that fail on an ndarray fall back to the scalar loop.
         """
+        buf = _as_ndarray(self)
+        if buf is not None and _vectorizable(map_func, vectorize, 1):
+            try:
+                result = map_func(_widened(buf))
+            except Exception:
+                result = None
+            if isinstance(result, np.ndarray) and result.shape == buf.shape:
+                return _from_ndarray(result)
+
         new_arr = DynamicArray()
 
         for i in range(self.size):
@@ -310,11 +939,26 @@ class DynamicArray:
         return new_arr
 
 
-    def filter(self, filter_func) -> object:
+    def filter(self, filter_func, vectorize: bool = False) -> object:
         """
         Creates a new Dynamic Array, populated with those elements from the original array for which filter_func returns True.
+        The new array uses the same storage mode (typecode) as the original.
+        With vectorize=True, for typed arrays with NumPy installed, filter_func (a unary NumPy ufunc
+        or any callable) returning a boolean mask is evaluated over the whole buffer at once,
+        widened to 64-bit elements as in map().
         """
-        new_arr = DynamicArray()
+        buf = _as_ndarray(self)
+        if buf is not None and _vectorizable(filter_func, vectorize, 1):
+            try:
+                mask = filter_func(_widened(buf))
+            except Exception:
+                mask = None
+            if isinstance(mask, np.ndarray) and mask.dtype == np.bool_ and mask.shape == buf.shape:
+                new_arr = self._new_like()
+                new_arr.extend(array(self.typecode, buf[mask].tobytes()))
+                return new_arr
+
+        new_arr = self._new_like()
 
         for i in range(self.size):
             value = self.get_at_index(i)
@@ -325,12 +969,84 @@ class DynamicArray:
         return new_arr
 
 
-    def reduce(self, reduce_func, initializer=None) -> object:
+    def _chunks(self, chunk_size: int):
+        """
+        Yield (typecode, payload) pairs covering the array in chunks of chunk_size elements.
+        Typed storage ships raw bytes; object storage ships a list of the chunk's values.
+        """
+        for start in range(0, self.size, chunk_size):
+            end = min(start + chunk_size, self.size)
+            if self.typecode is not None:
+                yield self.typecode, self.data[start:end].tobytes()
+            else:
+                yield None, [self.data[i] for i in range(start, end)]
+
+    def _chunk_size(self, workers: int, chunk_size: int) -> int:
+        """
+        Return chunk_size, or a default giving each worker about four chunks
+        """
+        if chunk_size is not None:
+            if chunk_size <= 0:
+                raise DynamicArrayException
+            return chunk_size
+        return max(1, -(-self.size // (workers * 4)))
+
+
+    def parallel_map(self, map_func, workers: int = None, chunk_size: int = None) -> object:
+        """
+        Same result as map(), but the array is split into chunks that are mapped in a process pool
+        of workers processes (default: CPU count) and reassembled in order.
+        map_func must be picklable (e.g. a module-level function).
+        """
+        new_arr = DynamicArray()
+        if self.size == 0:
+            return new_arr
+
+        workers = workers or cpu_count() or 1
+        chunk_size = self._chunk_size(workers, chunk_size)
+        chunk_typecodes, payloads = zip(*self._chunks(chunk_size))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(_map_chunk, [map_func] * len(payloads), chunk_typecodes, payloads):
+                new_arr.extend(results)
+
+        return new_arr
+
+
+    def parallel_reduce(self, reduce_func, initializer=None, workers: int = None, chunk_size: int = None) -> object:
+        """
+        Same result as reduce() for an associative reduce_func: each chunk is folded in a process pool
+        of workers processes (default: CPU count), then the chunk results are folded in order,
+        starting from the initializer if one is given.
+        reduce_func must be picklable (e.g. a module-level function).
+        """
+        if self.size == 0:
+            return initializer
+
+        workers = workers or cpu_count() or 1
+        chunk_size = self._chunk_size(workers, chunk_size)
+        chunk_typecodes, payloads = zip(*self._chunks(chunk_size))
+        result = initializer
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_result in executor.map(_reduce_chunk, [reduce_func] * len(payloads), chunk_typecodes, payloads):
+                result = chunk_result if result is None else reduce_func(result, chunk_result)
+
+        return result
+
+
+    def reduce(self, reduce_func, initializer=None, vectorize: bool = False) -> object:
         """
         Sequentially applies the reduce_func to all elements of the Dynamic Array and returns the resulting value.
         If no initializer: the first value in the array is the initializer.
         If the array is empty: returns the value of the initializer or None if not provided.
+        With vectorize=True, for typed arrays with NumPy installed, a binary NumPy ufunc (e.g. numpy.add)
+        is reduced over the whole buffer at once, widened to 64-bit elements as in map().
         """
+        buf = _as_ndarray(self)
+        if buf is not None and _vectorizable(reduce_func, vectorize, 2):
+            buf = _widened(buf)
+            if initializer is not None:
+                return reduce_func.reduce(buf, initial=initializer).item()
+            return reduce_func.reduce(buf).item()
 
         if self.size == 0:
             if initializer is not None:
@@ -369,3 +1085,474 @@ class DynamicArray:
 
         return final_result
 
+
+# file layout: 16-byte header (magic, typecode, item size, padding, element count), then the raw elements
+_MAPPED_HEADER = struct.Struct('<4scB2xQ')
+_MAPPED_MAGIC = b'DYNA'
+_MAPPED_TYPECODES = 'bBhHiIlLqQfd'
+
+
+def _writable_only(method):
+    """
+    Wrap a DynamicArray mutator so it raises DynamicArrayException on a read-only mapping
+    """
+    def wrapper(self, *args, **kwargs):
+        if not self.writable:
+            raise DynamicArrayException
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class MappedDynamicArray(DynamicArray):
+    def __init__(self, path: str, typecode=None, mode: str = 'r', growth=None, shrink=None):
+        """
+        Init typed dynamic array whose storage is a memory-mapped file
+        The element count lives in the file header, so the array survives process restarts,
+        and any number of processes can map the same file read-only without copying it.
+        resize() grows or truncates the file in place instead of copying elements.
+        """
+        if mode not in ('r', 'r+', 'w+'):
+            raise DynamicArrayException
+        self.path = path
+        self.writable = mode != 'r'
+        self.growth = growth if growth is not None else FactorGrowth()
+        self.shrink = shrink if shrink is not None else QuarterShrink()
+        self.resize_count = 0
+        self.copied_count = 0
+        self._shared = False
+
+        if mode == 'w+':
+            if typecode is None or typecode not in _MAPPED_TYPECODES:
+                raise DynamicArrayException
+            self.typecode = typecode
+            self.file = open(path, 'w+b')
+            self.file.truncate(_MAPPED_HEADER.size + 4 * array(typecode).itemsize)
+            self._size = 0
+            self._map()
+            self.size = 0
+        else:
+            self.file = open(path, 'r+b' if self.writable else 'rb')
+            try:
+                header = self.file.read(_MAPPED_HEADER.size)
+                if len(header) != _MAPPED_HEADER.size:
+                    raise DynamicArrayException
+                magic, code, itemsize, size = _MAPPED_HEADER.unpack(header)
+                code = code.decode('latin-1')
+                # the item size of 'l'/'L' differs between platforms: refuse files written with another one
+                if magic != _MAPPED_MAGIC or code not in _MAPPED_TYPECODES or itemsize != array(code).itemsize or \
+                        (typecode is not None and typecode != code):
+                    raise DynamicArrayException
+                self.typecode = code
+                self._size = size
+                self._map()
+            except BaseException:
+                self.file.close()
+                raise
+            if self._size > self.capacity:
+                # header claims more elements than the file holds
+                self.close()
+                raise DynamicArrayException
+
+    def _map(self) -> None:
+        """
+        Map the file and expose its element area as a typed memoryview
+        """
+        self.mmap = mmap(self.file.fileno(), 0, access=ACCESS_WRITE if self.writable else ACCESS_READ)
+        self.data = memoryview(self.mmap)[_MAPPED_HEADER.size:].cast(self.typecode)
+        self.capacity = len(self.data)
+
+    def _unmap(self) -> None:
+        """
+        Release the memoryview and close the mapping (the file stays open)
+        """
+        self.data.release()
+        self.mmap.close()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of elements stored, kept in sync with the file header
+        """
+        return self._size
+
+    @size.setter
+    def size(self, value: int) -> None:
+        if not self.writable:
+            raise DynamicArrayException
+        self._size = value
+        _MAPPED_HEADER.pack_into(self.mmap, 0, _MAPPED_MAGIC, self.typecode.encode(), self.data.itemsize, value)
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Grows or truncates the backing file to new_capacity elements and remaps it.
+        Elements stay where they are in the file, so nothing is copied.
+        If not positive or if new_capacity < self.size: exit.
+        """
+        if not self.writable:
+            raise DynamicArrayException
+        if new_capacity is None:
+            new_capacity = self.capacity * 2
+        elif new_capacity <= 0 or new_capacity < self.size:
+            return self
+
+        self.flush()
+        self._unmap()
+        self.file.truncate(_MAPPED_HEADER.size + new_capacity * array(self.typecode).itemsize)
+        self._map()
+        self.resize_count += 1
+
+        return self
+
+    set_at_index = _writable_only(DynamicArray.set_at_index)
+    append = _writable_only(DynamicArray.append)
+    extend = _writable_only(DynamicArray.extend)
+    insert_at_index = _writable_only(DynamicArray.insert_at_index)
+    insert_many = _writable_only(DynamicArray.insert_many)
+    remove_at_index = _writable_only(DynamicArray.remove_at_index)
+    remove_range = _writable_only(DynamicArray.remove_range)
+    set_many = _writable_only(DynamicArray.set_many)
+    sort = _writable_only(DynamicArray.sort)
+
+    def snapshot(self) -> object:
+        """
+        Returns an immutable DynamicArraySnapshot of the current contents.
+        A mapping cannot be shared copy-on-write with an in-memory snapshot,
+        so the live elements are copied: O(N).
+        """
+        return DynamicArraySnapshot(array(self.typecode, self.data[:self.size]), self.size, self.typecode)
+
+    def flush(self) -> None:
+        """
+        Writes dirty pages of the mapping back to the file
+        """
+        if self.writable and not self.mmap.closed:
+            self.mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and unmaps the array and closes the file
+        """
+        if self.file.closed:
+            return
+        self.flush()
+        self._unmap()
+        self.file.close()
+
+    def __enter__(self) -> object:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class DynamicArrayView:
+    def __init__(self, parent: DynamicArray, offset: int, count: int):
+        """
+        Init new window over parent[offset:offset + count]
+        The view reads and writes the parent's storage in place; once the parent resizes
+        (or shrinks below the window) every access raises DynamicArrayException.
+        """
+        self.parent = parent
+        self.offset = offset
+        self.count = count
+        self.resize_count = parent.resize_count
+
+    def __str__(self) -> str:
+        """
+        Return content of the view in human-readable form
+        """
+        out = "DYN_ARR_VIEW Offset/Size: "
+        out += str(self.offset) + "/" + str(self.count) + ' ['
+        out += ', '.join([str(value) for value in self])
+        return out + ']'
+
+    def is_valid(self) -> bool:
+        """
+        Return True if the parent has not resized or shrunk below the window since the view was made
+        """
+        return self.parent.resize_count == self.resize_count and self.offset + self.count <= self.parent.size
+
+    def _check(self) -> None:
+        """
+        Raise DynamicArrayException if the parent has been resized or shrunk under the view
+        """
+        if not self.is_valid():
+            raise DynamicArrayException
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position of the view
+        Invalid index or stale view raises DynamicArrayException
+        """
+        if index < 0 or index >= self.count:
+            raise DynamicArrayException
+        self._check()
+        return self.parent.data[self.offset + index]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index of the view (writes through to the parent)
+        Invalid index or stale view raises DynamicArrayException
+        """
+        if index < 0 or index >= self.count:
+            raise DynamicArrayException
+        self._check()
+        self.parent._before_write()
+        self.parent.data[self.offset + index] = value
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index() method above,
+        but called using view[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index() method above,
+        but called using view[index] syntax
+        """
+        self.set_at_index(index, value)
+
+    def __iter__(self):
+        """
+        Iterate over the values in the window
+        """
+        for i in range(self.offset, self.offset + self.count):
+            self._check()
+            yield self.parent.data[i]
+
+    def is_empty(self) -> bool:
+        """
+        Return True if the view is empty / False otherwise
+        """
+        return self.count == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements in the view
+        """
+        return self.count
+
+    def size(self) -> int:
+        """
+        StaticArray-style alias of length(), used by binary_search()
+        """
+        return self.count
+
+    def get(self, index: int) -> object:
+        """
+        StaticArray-style alias of get_at_index(), used by binary_search()
+        """
+        return self.get_at_index(index)
+
+    def stream(self) -> object:
+        """
+        Returns a lazy DynamicArrayStream over the values in the view
+        """
+        return DynamicArrayStream(iter(self))
+
+    def map(self, map_func) -> DynamicArray:
+        """
+        Creates a new Dynamic Array (object storage) by applying map_func to every value in the view
+        """
+        new_arr = DynamicArray()
+        new_arr.extend(map_func(value) for value in self)
+        return new_arr
+
+    def filter(self, filter_func) -> DynamicArray:
+        """
+        Creates a new Dynamic Array, using the parent's storage mode, populated with
+        those values from the view for which filter_func returns True
+        """
+        new_arr = self.parent._new_like()
+        new_arr.extend(value for value in self if filter_func(value) is True)
+        return new_arr
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Sequentially applies the reduce_func to all values in the view and returns the resulting value.
+        If no initializer: the first value in the view is the initializer.
+        If the view is empty: returns the value of the initializer or None if not provided.
+        """
+        values = iter(self)
+        result = initializer
+        if result is None:
+            result = next(values, None)
+
+        for value in values:
+            result = reduce_func(result, value)
+
+        return result
+
+
+class DynamicArraySnapshot:
+    def __init__(self, data, size: int, typecode=None):
+        """
+        Init new read-only snapshot of the first size elements of a Dynamic Array's storage
+        The storage is shared with the array; see DynamicArray.snapshot().
+        """
+        self.data = data
+        self.size = size
+        self.typecode = typecode
+
+    def __str__(self) -> str:
+        """
+        Return content of the snapshot in human-readable form
+        """
+        out = "DYN_ARR_SNAPSHOT Size: " + str(self.size) + ' ['
+        out += ', '.join([str(value) for value in self])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Iterate over the values in the snapshot
+        """
+        data = self.data
+        for i in range(self.size):
+            yield data[i]
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self.size:
+            raise DynamicArrayException
+        return self.data[index]
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index() method above,
+        but called using snapshot[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Snapshots are immutable: always raises DynamicArrayException
+        """
+        raise DynamicArrayException
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Snapshots are immutable: always raises DynamicArrayException
+        """
+        raise DynamicArrayException
+
+    def is_empty(self) -> bool:
+        """
+        Return True if the snapshot is empty / False otherwise
+        """
+        return self.size == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements in the snapshot
+        """
+        return self.size
+
+    def stream(self) -> object:
+        """
+        Returns a lazy DynamicArrayStream over the values in the snapshot
+        """
+        return DynamicArrayStream(iter(self))
+
+    def to_array(self) -> DynamicArray:
+        """
+        Returns a new, mutable Dynamic Array holding a copy of the snapshot's values
+        """
+        new_arr = DynamicArray(typecode=self.typecode)
+        new_arr.extend(self.data[:self.size] if self.typecode is not None else list(self))
+        return new_arr
+
+    def map(self, map_func) -> DynamicArray:
+        """
+        Creates a new Dynamic Array (object storage) by applying map_func to every value in the snapshot
+        """
+        return self.stream().map(map_func).collect()
+
+    def filter(self, filter_func) -> DynamicArray:
+        """
+        Creates a new Dynamic Array, in the snapshot's storage mode, populated with
+        those values for which filter_func returns True
+        """
+        return self.stream().filter(filter_func).collect(self.typecode)
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Sequentially applies the reduce_func to all values in the snapshot and returns the resulting value.
+        If no initializer: the first value is the initializer.
+        If the snapshot is empty: returns the value of the initializer or None if not provided.
+        """
+        return self.stream().reduce(reduce_func, initializer)
+
+
+class DynamicArrayStream:
+    def __init__(self, source):
+        """
+        Init new lazy pipeline over an iterator of values
+        Stages only wrap the iterator; nothing is evaluated until the stream is
+        iterated, collected or reduced, and a stream can be consumed only once.
+        """
+        self.source = source
+
+    def __iter__(self):
+        """
+        Iterate over the values produced by the pipeline
+        """
+        return self.source
+
+    def map(self, map_func) -> object:
+        """
+        Adds a stage applying map_func to every value
+        """
+        return DynamicArrayStream(map_func(value) for value in self.source)
+
+    def filter(self, filter_func) -> object:
+        """
+        Adds a stage keeping the values for which filter_func returns True
+        """
+        return DynamicArrayStream(value for value in self.source if filter_func(value) is True)
+
+    def take(self, count: int) -> object:
+        """
+        Adds a stage that stops the pipeline after count values
+        Upstream stages are not evaluated past that point.
+        """
+        if count < 0:
+            raise DynamicArrayException
+        return DynamicArrayStream(islice(self.source, count))
+
+    def skip(self, count: int) -> object:
+        """
+        Adds a stage that drops the first count values
+        """
+        if count < 0:
+            raise DynamicArrayException
+        return DynamicArrayStream(islice(self.source, count, None))
+
+    def collect(self, typecode=None) -> DynamicArray:
+        """
+        Runs the pipeline and returns its values in a new Dynamic Array
+        """
+        new_arr = DynamicArray(typecode=typecode)
+        new_arr.extend(self.source)
+        return new_arr
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Runs the pipeline, sequentially applying reduce_func to its values, and returns the resulting value.
+        If no initializer: the first value is the initializer.
+        If the pipeline yields no values: returns the value of the initializer or None if not provided.
+        """
+        result = initializer
+        if result is None:
+            result = next(self.source, None)
+
+        for value in self.source:
+            result = reduce_func(result, value)
+
+        return result
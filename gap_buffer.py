@@ -0,0 +1,232 @@
+# Author: Jin Huang
+# Description: Implement a GapBuffer class, a sequence with the Dynamic Array interface
+#              for insert/remove workloads clustered around a moving cursor.
+
+from dynamic_array import *
+
+
+class GapBuffer:
+    def __init__(self, start_array=None):
+        """
+        Init new gap buffer
+        Elements live in one StaticArray with an unused gap [gap_start, gap_end) in the middle.
+        Inserts and removals happen at the gap, so edits at or near the last edit position are O(1);
+        edits elsewhere first move the gap, costing O(distance moved).
+        """
+        self.size = 0
+        self.capacity = 4
+        self.data = StaticArray(self.capacity)
+        self.gap_start = 0
+        self.gap_end = self.capacity
+
+        if start_array is not None:
+            for value in start_array:
+                self.append(value)
+
+    def __str__(self) -> str:
+        """
+        Return content of gap buffer in human-readable form
+        """
+        out = "GAP_BUF Size/Cap: "
+        out += str(self.size) + "/" + str(self.capacity) + ' ['
+        out += ', '.join([str(value) for value in self])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Iterate over the stored values in index order, skipping the gap
+        """
+        for i in range(self.gap_start):
+            yield self.data[i]
+        for i in range(self.gap_end, self.capacity):
+            yield self.data[i]
+
+    def _physical(self, index: int) -> int:
+        """
+        Return the StaticArray position holding logical index
+        """
+        if index < self.gap_start:
+            return index
+        return index + self.gap_end - self.gap_start
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self.size:
+            raise DynamicArrayException
+        return self.data[self._physical(index)]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index in the buffer
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self.size:
+            raise DynamicArrayException
+        self.data[self._physical(index)] = value
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index() method above,
+        but called using buffer[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index() method above,
+        but called using buffer[index] syntax
+        """
+        self.set_at_index(index, value)
+
+    def is_empty(self) -> bool:
+        """
+        Return True if buffer is empty / False otherwise
+        """
+        return self.size == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements stored in buffer
+        """
+        return self.size
+
+    # -----------------------------------------------------------------------
+
+    def _move_gap(self, index: int) -> None:
+        """
+        Moves the gap so that it starts at logical index
+        Only the elements between the old and new gap position are moved.
+        """
+        data = self.data
+        if index < self.gap_start:
+            # move elements [index, gap_start) to the end of the gap, back to front
+            for i in range(self.gap_start - 1, index - 1, -1):
+                value = data[i]
+                data[i] = None
+                self.gap_end -= 1
+                data[self.gap_end] = value
+            self.gap_start = index
+        elif index > self.gap_start:
+            # move the first elements after the gap to its front
+            for _ in range(index - self.gap_start):
+                value = data[self.gap_end]
+                data[self.gap_end] = None
+                data[self.gap_start] = value
+                self.gap_start += 1
+                self.gap_end += 1
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the storage, keeping the gap position.
+        If new_capacity < self.size: exit.
+        """
+        if new_capacity < self.size or new_capacity <= 0:
+            return self
+
+        old_data = self.data
+        tail = self.capacity - self.gap_end
+        self.data = StaticArray(new_capacity)
+        for i in range(self.gap_start):
+            self.data[i] = old_data[i]
+        for i in range(tail):
+            self.data[new_capacity - tail + i] = old_data[self.gap_end + i]
+        self.gap_end = new_capacity - tail
+        self.capacity = new_capacity
+
+        return self
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Adds a new value at the specified index position in the buffer.
+        If index invalid: raises a "DynamicArrayException".
+        If storage is full, double the capacity, then add a new value.
+        """
+        if index < 0 or index > self.size:
+            raise DynamicArrayException
+
+        if self.gap_start == self.gap_end:
+            self.resize(self.capacity * 2)
+
+        self._move_gap(index)
+        self.data[self.gap_start] = value
+        self.gap_start += 1
+        self.size += 1
+
+        return self
+
+    def append(self, value: object) -> None:
+        """
+        Adds a new value at the end of the buffer.
+        """
+        return self.insert_at_index(self.size, value)
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Removes the element at the specified index position.
+        If invalid index: raises DynamicArrayException
+        Valid indices: [0, N-1]
+        """
+        if index < 0 or index >= self.size:
+            raise DynamicArrayException
+
+        self._move_gap(index)
+        self.data[self.gap_end] = None
+        self.gap_end += 1
+        self.size -= 1
+
+        return self
+
+    def slice(self, start_index: int, size: int) -> object:
+        """
+        Returns a new GapBuffer that contains the requested number of elements from the original buffer.
+        If start index or size is invalid or if not enough elements:
+            Raises DynamicArrayException.
+        """
+        if size < 0 or start_index < 0 or start_index + size > self.size:
+            raise DynamicArrayException
+
+        new_buf = GapBuffer()
+        for i in range(start_index, start_index + size):
+            new_buf.append(self.get_at_index(i))
+
+        return new_buf
+
+    def merge(self, second_da: object) -> None:
+        """
+        Takes another GapBuffer (or Dynamic Array) and appends all elements to the current buffer.
+        """
+        for value in list(second_da):
+            self.append(value)
+
+        return self
+
+    def map(self, map_func) -> object:
+        """
+        Creates a new GapBuffer by applying map_func to every element of the original buffer.
+        """
+        return GapBuffer(map_func(value) for value in self)
+
+    def filter(self, filter_func) -> object:
+        """
+        Creates a new GapBuffer, populated with those elements for which filter_func returns True.
+        """
+        return GapBuffer(value for value in self if filter_func(value) is True)
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Sequentially applies the reduce_func to all elements of the buffer and returns the resulting value.
+        If no initializer: the first value in the buffer is the initializer.
+        If the buffer is empty: returns the value of the initializer or None if not provided.
+        """
+        values = iter(self)
+        result = initializer
+        if result is None:
+            result = next(values, None)
+
+        for value in values:
+            result = reduce_func(result, value)
+
+        return result
@@ -1,5 +1,5 @@
 # Student Name: Jin Huang
-# Description: Implement a Queue ADT class using the Dynamic Array data structure.
+# Description: Implement a Queue ADT class using a circular buffer over a StaticArray.
 
 from dynamic_array import *
 
@@ -12,53 +12,163 @@ class QueueException(Exception):
 
 
 class Queue:
-    def __init__(self):
+    def __init__(self, shrink=None):
         """
-        Init new queue based on Dynamic Array
+        Init new queue based on a circular buffer
+        Elements occupy current_size consecutive slots of a StaticArray starting at index front,
+        wrapping around the end, so both enqueue and dequeue are O(1) amortized.
+        shrink is a Dynamic Array shrink policy (default: QuarterShrink()) applied after removals,
+        so the buffer is given back once a burst has been consumed.
         """
-        self.da = DynamicArray()
+        self.sa = StaticArray(4)
+        self.front = 0
+        self.current_size = 0
+        self.shrink = shrink if shrink is not None else QuarterShrink()
 
     def __str__(self):
         """
         Return content of stack in human-readable form
         """
-        out = "QUEUE: " + str(self.da.length()) + " elements. ["
-        out += ', '.join([str(self.da[i]) for i in range(self.da.length())])
+        out = "QUEUE: " + str(self.current_size) + " elements. ["
+        out += ', '.join([str(value) for value in self])
         return out + ']'
 
+    def __iter__(self):
+        """
+        Iterate over the queued values from front to back
+        """
+        capacity = self.sa.size()
+        for i in range(self.current_size):
+            yield self.sa[(self.front + i) % capacity]
+
     def is_empty(self) -> bool:
         """
         Return True is the queue is empty, False otherwise
         """
-        return self.da.is_empty()
+        return self.current_size == 0
 
     def size(self) -> int:
         """
         Return number of elements currently in the queue
         """
-        return self.da.length()
+        return self.current_size
 
     # -----------------------------------------------------------------------
 
+    def _resize(self, new_capacity: int) -> None:
+        """
+        Moves the elements into a new StaticArray of new_capacity slots,
+        unwrapping the ring so the front lands at index 0 (each element is copied once)
+        """
+        old_sa = self.sa
+        capacity = old_sa.size()
+        self.sa = StaticArray(new_capacity)
+        for i in range(self.current_size):
+            self.sa[i] = old_sa[(self.front + i) % capacity]
+        self.front = 0
+
+    def _reduce(self) -> None:
+        """
+        Moves the elements into a smaller ring if the shrink policy asks for less storage
+        """
+        new_capacity = self.shrink.shrink(self.current_size, self.sa.size())
+        if new_capacity is not None and new_capacity < self.sa.size():
+            self._resize(new_capacity)
+
     def enqueue(self, value: object) -> None:
         """
         Adds a new value to the end of the queue.
         O(1) amortized runtime complexity.
         """
-        self.da.append(value)
+        capacity = self.sa.size()
+        if self.current_size == capacity:
+            self._resize(capacity * 2)
+            capacity *= 2
+
+        self.sa[(self.front + self.current_size) % capacity] = value
+        self.current_size += 1
+
         return self
 
 
     def dequeue(self) -> object:
         """
         Removes and returns the value at the beginning of the queue.
-        O(N) runtime complexity.
+        O(1) amortized runtime complexity.
         If empty queue: raises "QueueException".
         """
-        if self.da.length() == 0:
+        if self.current_size == 0:
+            raise QueueException
+
+        first_value = self.sa[self.front]
+        self.sa[self.front] = None
+        self.front = (self.front + 1) % self.sa.size()
+        self.current_size -= 1
+        self._reduce()
+
+        return first_value
+
+
+    def enqueue_many(self, values) -> None:
+        """
+        Adds every value from an iterable (or Dynamic Array) to the end of the queue, in order.
+        The buffer grows at most once for the whole batch.
+        """
+        if isinstance(values, DynamicArray) or not hasattr(values, '__len__'):
+            values = list(values)
+        count = len(values)
+
+        capacity = self.sa.size()
+        if self.current_size + count > capacity:
+            capacity = max(self.current_size + count, capacity * 2)
+            self._resize(capacity)
+
+        sa = self.sa
+        index = (self.front + self.current_size) % capacity
+        for value in values:
+            sa[index] = value
+            index += 1
+            if index == capacity:
+                index = 0
+        self.current_size += count
+
+        return self
+
+
+    def dequeue_many(self, count: int) -> DynamicArray:
+        """
+        Removes the first count values of the queue and returns them, in order, in a Dynamic Array.
+        The bounds are checked once and the values are moved in a single pass.
+        If count is negative or larger than the queue: raises "QueueException".
+        """
+        if count < 0 or count > self.current_size:
             raise QueueException
 
-        else:
-            first_value = self.da.get_at_index(0)
-            self.da.remove_at_index(0)
-            return first_value
+        values = DynamicArray()
+        values.reserve(count)
+        sa = self.sa
+        capacity = sa.size()
+        index = self.front
+        for i in range(count):
+            values.data[i] = sa[index]
+            sa[index] = None
+            index += 1
+            if index == capacity:
+                index = 0
+        values.size = count
+
+        self.front = index
+        self.current_size -= count
+        self._reduce()
+
+        return values
+
+
+    def drain(self) -> DynamicArray:
+        """
+        Removes every value from the queue and returns them, in order, in a Dynamic Array.
+        """
+        values = self.dequeue_many(self.current_size)
+        self.front = 0
+
+        return values
@@ -0,0 +1,228 @@
+# Author: Jin Huang
+# Description: Implement a SegmentedDynamicArray class: a Dynamic Array stored as a directory
+#              of fixed-size blocks, so growing never copies existing elements.
+
+from dynamic_array import *
+
+
+class SegmentedDynamicArray:
+    def __init__(self, start_array=None, typecode=None, block_size: int = 1024):
+        """
+        Init new segmented dynamic array
+        Elements live in fixed-size blocks listed in a directory (a Dynamic Array of blocks).
+        Index i is found in block i // block_size at offset i % block_size, so access stays O(1),
+        and growth only allocates one new block: append never copies existing elements.
+        (The directory still doubles, but it holds one reference per block, not per element.)
+        block_size must be a power of two; typecode works as in DynamicArray.
+        """
+        if block_size <= 0 or block_size & (block_size - 1):
+            raise DynamicArrayException
+        if typecode is not None and typecode not in typecodes:
+            raise DynamicArrayException
+        self.typecode = typecode
+        self.block_size = block_size
+        self.shift = block_size.bit_length() - 1
+        self.mask = block_size - 1
+        self.blocks = DynamicArray()
+        self.size = 0
+        self.capacity = 0
+
+        if start_array is not None:
+            for value in start_array:
+                self.append(value)
+
+    def __str__(self) -> str:
+        """
+        Return content of segmented array in human-readable form
+        """
+        out = "SEG_ARR Size/Cap: "
+        out += str(self.size) + "/" + str(self.capacity) + ' ['
+        out += ', '.join([str(value) for value in self])
+        return out + ']'
+
+    def __iter__(self):
+        """
+        Iterate over the stored values in index order, one block at a time
+        """
+        remaining = self.size
+        for b in range(self.blocks.length()):
+            if remaining <= 0:
+                return
+            block = self.blocks[b]
+            for i in range(min(remaining, self.block_size)):
+                yield block[i]
+            remaining -= self.block_size
+
+    def get_at_index(self, index: int) -> object:
+        """
+        Return value from given index position
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self.size:
+            raise DynamicArrayException
+        return self.blocks.data[index >> self.shift][index & self.mask]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """
+        Store value at given index in the array
+        Invalid index raises DynamicArrayException
+        """
+        if index < 0 or index >= self.size:
+            raise DynamicArrayException
+        self.blocks.data[index >> self.shift][index & self.mask] = value
+
+    def __getitem__(self, index) -> object:
+        """
+        Same functionality as get_at_index() method above,
+        but called using array[index] syntax
+        """
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Same functionality as set_at_index() method above,
+        but called using array[index] syntax
+        """
+        self.set_at_index(index, value)
+
+    def is_empty(self) -> bool:
+        """
+        Return True if array is empty / False otherwise
+        """
+        return self.size == 0
+
+    def length(self) -> int:
+        """
+        Return number of elements stored in array
+        """
+        return self.size
+
+    # -----------------------------------------------------------------------
+
+    def _new_block(self) -> object:
+        """
+        Return an empty block: a StaticArray in object mode, a zero-filled array in typed mode
+        """
+        if self.typecode is None:
+            return StaticArray(self.block_size)
+        return array(self.typecode, bytes(self.block_size * array(self.typecode).itemsize))
+
+    def _new_like(self) -> object:
+        """
+        Return a new empty segmented array using the same storage mode and block size
+        """
+        return SegmentedDynamicArray(typecode=self.typecode, block_size=self.block_size)
+
+    def append(self, value: object) -> None:
+        """
+        Adds a new value at the end of the array.
+        If every block is full, one new block is added; existing elements are never copied.
+        """
+        if self.size == self.capacity:
+            self.blocks.append(self._new_block())
+            self.capacity += self.block_size
+
+        index = self.size
+        self.blocks.data[index >> self.shift][index & self.mask] = value
+        self.size += 1
+
+        return self
+
+    def extend(self, values) -> object:
+        """
+        Appends every value from an iterable to the end of the array.
+        """
+        for value in values:
+            self.append(value)
+
+        return self
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+        Adds a new value at the specified index position, shifting later elements right.
+        If index invalid: raises a "DynamicArrayException".
+        O(N - index): the shift crosses block boundaries.
+        """
+        if index < 0 or index > self.size:
+            raise DynamicArrayException
+
+        self.append(value)
+        for i in range(self.size - 1, index, -1):
+            self.set_at_index(i, self.get_at_index(i - 1))
+        self.set_at_index(index, value)
+
+        return self
+
+    def remove_at_index(self, index: int) -> None:
+        """
+        Removes the element at the specified index position, shifting later elements left.
+        If invalid index: raises DynamicArrayException
+        Valid indices: [0, N-1]
+        A trailing block is released only once more than two whole blocks are free, so up to
+        two spare blocks are kept and alternating append/remove at a block boundary does not thrash.
+        """
+        if index < 0 or index >= self.size:
+            raise DynamicArrayException
+
+        for i in range(index, self.size - 1):
+            self.set_at_index(i, self.get_at_index(i + 1))
+        if self.typecode is None:
+            self.set_at_index(self.size - 1, None)
+        self.size -= 1
+
+        if self.capacity - self.size > 2 * self.block_size:
+            self.blocks.remove_at_index(self.blocks.length() - 1)
+            self.capacity -= self.block_size
+
+        return self
+
+    def slice(self, start_index: int, size: int) -> object:
+        """
+        Returns a new segmented array that contains the requested number of elements from the original array.
+        If start index or size is invalid or if not enough elements:
+            Raises DynamicArrayException.
+        """
+        if size < 0 or start_index < 0 or start_index + size > self.size:
+            raise DynamicArrayException
+
+        new_arr = self._new_like()
+        for i in range(start_index, start_index + size):
+            new_arr.append(self.get_at_index(i))
+
+        return new_arr
+
+    def merge(self, second_da: object) -> None:
+        """
+        Takes another array and appends all elements to the current array.
+        """
+        return self.extend(list(second_da))
+
+    def map(self, map_func) -> object:
+        """
+        Creates a new segmented array (object storage) by applying map_func to every element.
+        """
+        return SegmentedDynamicArray((map_func(value) for value in self), block_size=self.block_size)
+
+    def filter(self, filter_func) -> object:
+        """
+        Creates a new segmented array, in the same storage mode, populated with those elements
+        for which filter_func returns True.
+        """
+        new_arr = self._new_like()
+        return new_arr.extend(value for value in self if filter_func(value) is True)
+
+    def reduce(self, reduce_func, initializer=None) -> object:
+        """
+        Sequentially applies the reduce_func to all elements of the array and returns the resulting value.
+        If no initializer: the first value in the array is the initializer.
+        If the array is empty: returns the value of the initializer or None if not provided.
+        """
+        values = iter(self)
+        result = initializer
+        if result is None:
+            result = next(values, None)
+
+        for value in values:
+            result = reduce_func(result, value)
+
+        return result
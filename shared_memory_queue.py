@@ -0,0 +1,175 @@
+# Author: Jin Huang
+# Description: Implement a SharedMemoryQueue class: a circular-buffer queue of fixed-size
+#              typed records living in multiprocessing shared memory, with no pickling.
+
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import struct
+from queue_dynamic_array import QueueException
+
+
+# layout: put_count and get_count (two unsigned 64-bit counters), then capacity records
+_HEADER = struct.Struct('<QQ')
+_COUNTER = struct.Struct('<Q')
+_PUT_COUNT = 0
+_GET_COUNT = 8
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Attach to an existing shared memory block without tracking it: the creating process owns it.
+    (Before Python 3.13 attaching always registers the block, but child processes share the
+    creator's resource tracker, so the registration is a no-op there.)
+    """
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:                   # Python < 3.13 has no track argument
+        return SharedMemory(name=name)
+
+
+class SharedMemoryQueue:
+    def __init__(self, record_format: str, capacity: int, multi_producer: bool = False,
+                 multi_consumer: bool = False, ctx=None):
+        """
+        Init new bounded queue of records packed with the struct format record_format
+        (e.g. '<dqi'), stored in a new shared memory block.
+        Records are tuples with one value per field; a single-field format takes and returns plain values.
+        Pass the queue to child processes as a Process argument; they attach to the same block.
+        As with multiprocessing.Queue, ctx is the multiprocessing context those processes are started
+        from (e.g. multiprocessing.get_context('spawn')); the default context is used if omitted.
+        By default exactly one process may put and one may get (single producer / single consumer),
+        which needs no locks: two semaphores count free and filled slots. multi_producer
+        and multi_consumer add a lock on the corresponding side.
+        The creating process should call unlink() once every process has called close().
+        """
+        if capacity <= 0:
+            raise QueueException
+        self.record_format = record_format
+        self.record = struct.Struct(record_format)
+        self.fields = len(self.record.unpack(bytes(self.record.size)))
+        self.capacity = capacity
+        self.shm = SharedMemory(create=True, size=_HEADER.size + capacity * self.record.size)
+        _HEADER.pack_into(self.shm.buf, 0, 0, 0)
+        self.owner = True
+        if ctx is None:
+            ctx = multiprocessing.get_context()
+        self.free_slots = ctx.Semaphore(capacity)
+        self.filled_slots = ctx.Semaphore(0)
+        self.put_lock = ctx.Lock() if multi_producer else None
+        self.get_lock = ctx.Lock() if multi_consumer else None
+
+    def __getstate__(self) -> dict:
+        """
+        Ship the block's name and the synchronization primitives, not the records
+        """
+        state = self.__dict__.copy()
+        del state['shm'], state['record']
+        state['name'] = self.shm.name
+        state['owner'] = False
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Attach to the shared memory block named in state
+        """
+        name = state.pop('name')
+        self.__dict__.update(state)
+        self.record = struct.Struct(self.record_format)
+        self.shm = _attach(name)
+
+    def __str__(self):
+        """
+        Return a summary of the queue in human-readable form
+        """
+        return "SHM_QUEUE: " + str(self.size()) + "/" + str(self.capacity) + " records of '" + \
+            self.record_format + "'."
+
+    def is_empty(self) -> bool:
+        """
+        Return True is the queue is empty, False otherwise (a snapshot under concurrency)
+        """
+        return self.size() == 0
+
+    def size(self) -> int:
+        """
+        Return number of records currently in the queue (a snapshot under concurrency)
+        """
+        put_count, get_count = _HEADER.unpack_from(self.shm.buf, 0)
+        return put_count - get_count
+
+    # -----------------------------------------------------------------------
+
+    def _offset(self, count: int) -> int:
+        """
+        Return the byte offset of the slot used by the count-th put/get
+        """
+        return _HEADER.size + (count % self.capacity) * self.record.size
+
+    def put(self, record, block: bool = True, timeout: float = None) -> None:
+        """
+        Packs record (a tuple matching record_format, or a plain value for a single-field format)
+        into the next slot.
+        If the queue is full, waits for a free slot (at most timeout seconds if given).
+        If no slot frees up in time, or the queue is full and block is False: raises "QueueException".
+        A record that does not match record_format also raises "QueueException".
+        """
+        if self.fields == 1:
+            record = (record,)
+        if not self.free_slots.acquire(block, timeout):
+            raise QueueException
+
+        if self.put_lock is not None:
+            self.put_lock.acquire()
+        try:
+            buf = self.shm.buf
+            put_count, = _COUNTER.unpack_from(buf, _PUT_COUNT)
+            self.record.pack_into(buf, self._offset(put_count), *record)
+            _COUNTER.pack_into(buf, _PUT_COUNT, put_count + 1)
+        except (struct.error, TypeError):
+            # record does not match record_format: give the slot back
+            self.free_slots.release()
+            raise QueueException
+        finally:
+            if self.put_lock is not None:
+                self.put_lock.release()
+        self.filled_slots.release()
+
+        return self
+
+    def get(self, block: bool = True, timeout: float = None) -> object:
+        """
+        Removes and returns the record at the beginning of the queue:
+        a tuple, or a plain value for a single-field format.
+        If the queue is empty, waits for a record (at most timeout seconds if given).
+        If none arrives in time, or the queue is empty and block is False: raises "QueueException".
+        """
+        if not self.filled_slots.acquire(block, timeout):
+            raise QueueException
+
+        if self.get_lock is not None:
+            self.get_lock.acquire()
+        try:
+            buf = self.shm.buf
+            get_count, = _COUNTER.unpack_from(buf, _GET_COUNT)
+            record = self.record.unpack_from(buf, self._offset(get_count))
+            _COUNTER.pack_into(buf, _GET_COUNT, get_count + 1)
+        finally:
+            if self.get_lock is not None:
+                self.get_lock.release()
+        self.free_slots.release()
+
+        return record[0] if self.fields == 1 else record
+
+    def close(self) -> None:
+        """
+        Detaches this process from the shared memory block
+        """
+        self.shm.close()
+
+    def unlink(self) -> None:
+        """
+        Frees the shared memory block; only the creating process may do this
+        """
+        if not self.owner:
+            raise QueueException
+        self.shm.unlink()